@@ -1,15 +1,18 @@
 """Trading constants for Nifty Expiry Predictor."""
 
 from dataclasses import dataclass
-from typing import Dict
-
-# Lot sizes for Indian derivatives
-LOT_SIZES: Dict[str, int] = {
-    "NIFTY": 50,
-    "BANKNIFTY": 25,
-    "FINNIFTY": 40,
-    "MIDCPNIFTY": 75,
-}
+from types import MappingProxyType
+from typing import Mapping
+
+# Lot sizes for Indian derivatives (read-only)
+LOT_SIZES: Mapping[str, int] = MappingProxyType(
+    {
+        "NIFTY": 50,
+        "BANKNIFTY": 25,
+        "FINNIFTY": 40,
+        "MIDCPNIFTY": 75,
+    }
+)
 
 # Contract multipliers
 CONTRACT_MULTIPLIER = 1
@@ -71,7 +74,7 @@ COMMISSION_PER_LOT = 20  # ₹20 per lot
 SLIPPAGE_POINTS = 2  # 2 points slippage
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingHours:
     """Trading hours configuration."""
 
@@ -81,7 +84,7 @@ class TradingHours:
     post_close: str = "16:00"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymbolInfo:
     """Symbol information."""
 
@@ -93,22 +96,28 @@ class SymbolInfo:
     @classmethod
     def get_nifty(cls) -> "SymbolInfo":
         """Get NIFTY symbol info."""
-        return cls(
-            symbol="NIFTY",
-            lot_size=LOT_SIZES["NIFTY"],
-            tick_size=0.05,
-            contract_multiplier=CONTRACT_MULTIPLIER,
-        )
+        return NIFTY
 
     @classmethod
     def get_banknifty(cls) -> "SymbolInfo":
         """Get BANKNIFTY symbol info."""
-        return cls(
-            symbol="BANKNIFTY",
-            lot_size=LOT_SIZES["BANKNIFTY"],
-            tick_size=0.05,
-            contract_multiplier=CONTRACT_MULTIPLIER,
-        )
+        return BANKNIFTY
+
+
+# Prebuilt (immutable) symbol info instances
+NIFTY = SymbolInfo(
+    symbol="NIFTY",
+    lot_size=LOT_SIZES["NIFTY"],
+    tick_size=0.05,
+    contract_multiplier=CONTRACT_MULTIPLIER,
+)
+
+BANKNIFTY = SymbolInfo(
+    symbol="BANKNIFTY",
+    lot_size=LOT_SIZES["BANKNIFTY"],
+    tick_size=0.05,
+    contract_multiplier=CONTRACT_MULTIPLIER,
+)
 
 
 # Expiry dates (to be updated periodically)
@@ -1,12 +1,42 @@
 """Logging configuration for Nifty Expiry Predictor."""
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
+from typing import Optional
 
 from config.settings import settings
 
+# Background listener draining queued records into the buffered file handler
+_listener: Optional[QueueListener] = None
+
+# Logging is configured on the first get_logger() call rather than at import
+_initialized = False
+_init_lock = threading.Lock()
+
+
+def _stop_listener():
+    """Stop the queue listener and flush any buffered file records."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging():
     """Configure logging for the application."""
@@ -14,16 +44,18 @@ def setup_logging():
     log_dir = Path(settings.log_file).parent
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+
     # Create logger
     logger = logging.getLogger("nifty_expiry")
-    logger.setLevel(getattr(logging, settings.log_level))
+    logger.setLevel(level)
 
     # Remove existing handlers
     logger.handlers.clear()
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, settings.log_level))
+    console_handler.setLevel(level)
     console_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -37,13 +69,27 @@ def setup_logging():
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
     )
-    file_handler.setLevel(getattr(logging, settings.log_level))
+    file_handler.setLevel(level)
     file_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # Batch file writes in memory; ERROR and above are flushed immediately
+    buffered_handler = MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+
+    # The logging call only enqueues; a listener thread does the file I/O
+    global _listener
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -57,10 +103,13 @@ def get_logger(name: str = None) -> logging.Logger:
     Returns:
         Logger instance
     """
+    global _initialized
+    if not _initialized:
+        with _init_lock:
+            if not _initialized:
+                setup_logging()
+                _initialized = True
+
     if name:
         return logging.getLogger(f"nifty_expiry.{name}")
     return logging.getLogger("nifty_expiry")
-
-
-# Initialize logging
-logger = setup_logging()
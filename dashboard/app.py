@@ -1,10 +1,9 @@
 """Streamlit dashboard for Nifty Expiry Predictor."""
 
+import time
+
+import numpy as np
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -13,10 +12,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.logging_config import get_logger
 from data.collectors.nse_scraper import NSEDataCollector
-from features.greeks_calculator import GreeksCalculator
-from features.gex_calculator import GammaExposureCalculator
-from features.max_pain import MaxPainCalculator
-from features.oi_analysis import OIAnalyzer
 
 logger = get_logger(__name__)
 
@@ -29,6 +24,69 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def _nse() -> NSEDataCollector:
+    """Get a shared NSE collector so its HTTP session survives reruns."""
+    return NSEDataCollector()
+
+
+@st.cache_resource
+def _max_pain_calculator():
+    """Get a shared Max Pain calculator, importing it on first use."""
+    from features.max_pain import MaxPainCalculator
+
+    return MaxPainCalculator()
+
+
+@st.cache_resource
+def _gex_calculator():
+    """Get a shared GEX calculator, importing it on first use."""
+    from features.gex_calculator import GammaExposureCalculator
+
+    return GammaExposureCalculator()
+
+
+@st.cache_data(ttl=30)
+def _load_chain(symbol: str):
+    """Fetch the option chain for a symbol, cached for 30 seconds.
+
+    Returns:
+        Tuple of (option_chain sorted by strike, spot, timestamp, fetch_id).
+        fetch_id is unique per fetch and keys the derived caches, since the
+        NSE timestamp can be missing or repeat across fetches.
+    """
+    option_chain = _nse().get_option_chain(symbol)
+    spot = option_chain.attrs.get("underlying", 0)
+    timestamp = option_chain.attrs.get("timestamp", "")
+    if not option_chain.empty:
+        option_chain = option_chain.sort_values(
+            "strike", kind="stable", ignore_index=True
+        )
+    return option_chain, spot, timestamp, time.time_ns()
+
+
+@st.cache_data(ttl=30)
+def _chain_arrays(symbol: str, fetch_id: int, _option_chain):
+    """Snapshot the chain into NumPy arrays once per fetch."""
+    from features.chain_arrays import to_chain_arrays
+
+    return to_chain_arrays(_option_chain)
+
+
+@st.cache_data(ttl=30)
+def _compute_max_pain(symbol: str, fetch_id: int, _chain):
+    """Calculate Max Pain once per fetched chain."""
+    return _max_pain_calculator().calculate_max_pain(_chain)
+
+
+@st.cache_data(ttl=30)
+def _compute_gex(symbol: str, fetch_id: int, _chain, spot: float, days_to_expiry: int):
+    """Calculate chain GEX and key levels once per fetched chain."""
+    gex_calc = _gex_calculator()
+    gex_df = gex_calc.calculate_chain_gex(_chain, spot, days_to_expiry=days_to_expiry)
+    return gex_df, gex_calc.find_gex_levels(gex_df, spot)
+
+
 def main():
     """Main dashboard application."""
     st.title("📈 Nifty Weekly Expiry Predictor")
@@ -48,19 +106,19 @@ def main():
         show_oi = st.checkbox("OI Analysis", value=True)
         show_pcr = st.checkbox("PCR Analysis", value=True)
 
+    if refresh_button:
+        for cached in (_load_chain, _chain_arrays, _compute_max_pain, _compute_gex):
+            cached.clear()
+
     # Fetch data
     with st.spinner("Fetching option chain data..."):
         try:
-            nse = NSEDataCollector()
-            option_chain = nse.get_option_chain(symbol)
+            option_chain, spot, timestamp, fetch_id = _load_chain(symbol)
             
             if option_chain.empty:
                 st.error("Failed to fetch option chain data")
                 return
             
-            spot = option_chain.attrs.get("underlying", 0)
-            timestamp = option_chain.attrs.get("timestamp", "")
-            
             st.success(f"✅ Data fetched successfully | Spot: {spot:.2f} | Time: {timestamp}")
             
         except Exception as e:
@@ -68,18 +126,20 @@ def main():
             logger.error(f"Dashboard error: {e}")
             return
 
+    # Columnar snapshot shared by the calculators below
+    chain = _chain_arrays(symbol, fetch_id, option_chain)
+
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
+    total_call_oi, total_put_oi = chain.call_oi.sum(), chain.put_oi.sum()
     
     with col1:
         st.metric("Spot Price", f"₹{spot:.2f}")
     
     with col2:
-        total_call_oi = option_chain["call_oi"].sum()
         st.metric("Total Call OI", f"{total_call_oi:,.0f}")
     
     with col3:
-        total_put_oi = option_chain["put_oi"].sum()
         st.metric("Total Put OI", f"{total_put_oi:,.0f}")
     
     with col4:
@@ -91,9 +151,11 @@ def main():
         st.markdown("---")
         st.subheader("📍 Max Pain Analysis")
         
+        import plotly.graph_objects as go
+
         try:
-            max_pain_calc = MaxPainCalculator()
-            max_pain, pain_df = max_pain_calc.calculate_max_pain(option_chain)
+            max_pain_calc = _max_pain_calculator()
+            max_pain, pain_df = _compute_max_pain(symbol, fetch_id, chain)
             
             col1, col2 = st.columns([2, 1])
             
@@ -126,7 +188,7 @@ def main():
                 st.metric("Distance from Spot", f"₹{distance:.0f}")
                 
                 # Support and resistance
-                sr_levels = max_pain_calc.find_support_resistance(option_chain, num_levels=3)
+                sr_levels = max_pain_calc.find_support_resistance(chain, num_levels=3)
                 st.write("**Resistance Levels:**")
                 for level in sr_levels["resistance"]:
                     st.write(f"- ₹{level:.0f}")
@@ -143,11 +205,13 @@ def main():
         st.markdown("---")
         st.subheader("🎲 Gamma Exposure (GEX) Analysis")
         
+        import plotly.graph_objects as go
+
         try:
-            gex_calc = GammaExposureCalculator()
             # Assume 1 day to expiry for demonstration
-            gex_df = gex_calc.calculate_chain_gex(option_chain, spot, days_to_expiry=1)
-            gex_levels = gex_calc.find_gex_levels(gex_df, spot)
+            gex_df, gex_levels = _compute_gex(
+                symbol, fetch_id, chain, spot, days_to_expiry=1
+            )
             
             col1, col2 = st.columns([2, 1])
             
@@ -158,7 +222,7 @@ def main():
                     x=gex_df["strike"],
                     y=gex_df["net_gex"],
                     name="Net GEX",
-                    marker_color=gex_df["net_gex"].apply(lambda x: "green" if x > 0 else "red")
+                    marker_color=np.where(gex_df["net_gex"].to_numpy() > 0, "green", "red")
                 ))
                 fig.add_vline(x=spot, line_dash="dash", line_color="blue",
                              annotation_text=f"Spot: {spot:.0f}")
@@ -188,12 +252,12 @@ def main():
     st.markdown("---")
     st.subheader("📊 Option Chain")
     
-    # Filter strikes near spot
+    # Filter strikes near spot (chain is sorted by strike in _load_chain)
     strike_range = 500
-    filtered_chain = option_chain[
-        (option_chain["strike"] >= spot - strike_range) &
-        (option_chain["strike"] <= spot + strike_range)
-    ].copy()
+    strikes = option_chain["strike"].to_numpy()
+    lo = np.searchsorted(strikes, spot - strike_range, side="left")
+    hi = np.searchsorted(strikes, spot + strike_range, side="right")
+    filtered_chain = option_chain.iloc[lo:hi]
     
     # Format for display
     display_df = filtered_chain[[
@@ -201,14 +265,12 @@ def main():
         "put_ltp", "put_volume", "put_oi"
     ]].copy()
     
-    # Highlight ATM strike
-    def highlight_atm(row):
-        if abs(row["strike"] - spot) < 50:
-            return ["background-color: yellow"] * len(row)
-        return [""] * len(row)
+    # Highlight ATM strike (one style vector shared by every column)
+    atm_mask = np.abs(display_df["strike"].to_numpy() - spot) < 50
+    atm_styles = np.where(atm_mask, "background-color: yellow", "")
     
     st.dataframe(
-        display_df.style.apply(highlight_atm, axis=1),
+        display_df.style.apply(lambda _: atm_styles, axis=0),
         use_container_width=True,
         height=400
     )
@@ -1,7 +1,9 @@
 """Broker API interfaces."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from functools import cache
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Type
 from datetime import datetime
 import pandas as pd
 
@@ -11,6 +13,14 @@ from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+@cache
+def _get_kite_class():
+    """Import and return the KiteConnect client class (imported once)."""
+    from kiteconnect import KiteConnect
+
+    return KiteConnect
+
+
 class BrokerInterface(ABC):
     """Abstract base class for broker API connections."""
 
@@ -109,9 +119,7 @@ class ZerodhaConnector(BrokerInterface):
     def connect(self) -> bool:
         """Connect to Zerodha Kite API."""
         try:
-            from kiteconnect import KiteConnect
-
-            self.kite = KiteConnect(api_key=self.api_key)
+            self.kite = _get_kite_class()(api_key=self.api_key)
 
             if self.access_token:
                 self.kite.set_access_token(self.access_token)
@@ -296,6 +304,16 @@ class AngelOneConnector(BrokerInterface):
         return None
 
 
+# Broker name -> connector class
+_BROKERS: Mapping[str, Type[BrokerInterface]] = MappingProxyType(
+    {
+        "zerodha": ZerodhaConnector,
+        "upstox": UpstoxConnector,
+        "angelone": AngelOneConnector,
+    }
+)
+
+
 def get_broker_connector(broker_name: str) -> Optional[BrokerInterface]:
     """Factory function to get broker connector.
 
@@ -305,13 +323,7 @@ def get_broker_connector(broker_name: str) -> Optional[BrokerInterface]:
     Returns:
         BrokerInterface instance or None
     """
-    brokers = {
-        "zerodha": ZerodhaConnector,
-        "upstox": UpstoxConnector,
-        "angelone": AngelOneConnector,
-    }
-
-    broker_class = brokers.get(broker_name.lower())
+    broker_class = _BROKERS.get(broker_name) or _BROKERS.get(broker_name.lower())
     if broker_class:
         return broker_class()
     else:
@@ -1,36 +1,178 @@
 """NSE data scraper for option chain and historical data."""
 
-import requests
+import asyncio
+import importlib.util
+import threading
+import httpx
+import numpy as np
 import pandas as pd
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 from pathlib import Path
 
+from cachetools import TTLCache
+
 from config.settings import settings
 from config.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from data.storage.cache import RedisCache
+
 logger = get_logger(__name__)
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Parquet copies of Bhavcopies need pyarrow
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+BASE_URL = "https://www.nseindia.com"
+OPTION_CHAIN_URL = f"{BASE_URL}/api/option-chain-indices"
+INDIA_VIX_URL = f"{BASE_URL}/api/equity-stockIndices?index=INDIA VIX"
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Shared connection pool settings for the sync and async clients
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20)
+CLIENT_TIMEOUT = httpx.Timeout(10.0)
+
+# Cache TTLs (seconds) aligned with how often NSE refreshes each endpoint
+OPTION_CHAIN_TTL = 5
+EXPIRY_DATES_TTL = 3600
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+_EMPTY_LEG: Mapping[str, Any] = MappingProxyType({})
+
+# (column suffix, NSE field, dtype) for each call/put leg of a strike
+_LEG_FIELDS = (
+    ("oi", "openInterest", np.int64),
+    ("oi_change", "changeinOpenInterest", np.int64),
+    ("volume", "totalTradedVolume", np.int64),
+    ("iv", "impliedVolatility", np.float64),
+    ("ltp", "lastPrice", np.float64),
+    ("bid", "bidprice", np.float64),
+    ("ask", "askPrice", np.float64),
+)
+
+
+def _parse_option_chain(data: Dict[str, Any], symbol: str) -> pd.DataFrame:
+    """Convert an NSE option chain JSON payload to a DataFrame.
+
+    Args:
+        data: Decoded JSON response from the option chain API
+        symbol: Index symbol the payload belongs to
+
+    Returns:
+        DataFrame with one row per strike/expiry
+    """
+    records = data.get("records", {})
+    option_data = records.get("data", [])
+    n = len(option_data)
+
+    # Parse option chain straight into one preallocated array per column
+    strike = np.zeros(n, dtype=np.float64)
+    expiry_date = np.empty(n, dtype=object)
+    columns = {
+        f"{side}_{name}": np.zeros(n, dtype=dtype)
+        for side in ("call", "put")
+        for name, _, dtype in _LEG_FIELDS
+    }
+    legs = [
+        (leg_key, [(columns[f"{side}_{name}"], field) for name, field, _ in _LEG_FIELDS])
+        for side, leg_key in (("call", "CE"), ("put", "PE"))
+    ]
+
+    for i, item in enumerate(option_data):
+        strike[i] = item.get("strikePrice") or 0
+        expiry_date[i] = item.get("expiryDate")
+        for leg_key, targets in legs:
+            leg = item.get(leg_key) or _EMPTY_LEG
+            for column, field in targets:
+                column[i] = leg.get(field) or 0
+
+    # Convert IV to decimal
+    columns["call_iv"] /= 100
+    columns["put_iv"] /= 100
+
+    df = pd.DataFrame({"strike": strike, "expiry_date": expiry_date, **columns})
+
+    # Store metadata
+    df.attrs["underlying"] = records.get("underlyingValue", 0)
+    df.attrs["timestamp"] = records.get("timestamp", "")
+    df.attrs["symbol"] = symbol
+
+    return df
+
+
+def _bhavcopy_filename(date: datetime) -> str:
+    """F&O Bhavcopy archive filename for a date."""
+    return f"fo{date.strftime('%d%m%y')}bhav.csv.zip"
+
+
+def _bhavcopy_url(date: datetime) -> str:
+    """Build the F&O Bhavcopy archive URL for a date."""
+    filename = _bhavcopy_filename(date)
+    return f"{BASE_URL}/content/historical/DERIVATIVES/{date.strftime('%Y/%b').upper()}/{filename}"
+
+
+def _transcode_bhavcopy(zip_path: Path) -> Optional[Path]:
+    """Convert a downloaded Bhavcopy archive to Parquet once.
+
+    Args:
+        zip_path: Path to the downloaded CSV.zip
+
+    Returns:
+        Path to the Parquet file, or None if it could not be written
+    """
+    parquet_path = zip_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        return parquet_path
+    if not PYARROW_AVAILABLE:
+        logger.warning("pyarrow not installed. Bhavcopy will not be converted to Parquet.")
+        return None
+
+    try:
+        df = pd.read_csv(zip_path, compression="zip")
+        df.to_parquet(parquet_path, engine="pyarrow", compression="lz4")
+        return parquet_path
+    except Exception as e:
+        logger.warning(f"Failed to convert {zip_path.name} to Parquet: {e}")
+        parquet_path.unlink(missing_ok=True)
+        return None
+
 
 class NSEDataCollector:
     """Collect data from NSE India website."""
 
-    BASE_URL = "https://www.nseindia.com"
-    OPTION_CHAIN_URL = f"{BASE_URL}/api/option-chain-indices"
+    BASE_URL = BASE_URL
+    OPTION_CHAIN_URL = OPTION_CHAIN_URL
     BHAVCOPY_URL = f"{BASE_URL}/products/content/sec_bhavdata_full.csv"
 
-    def __init__(self):
-        """Initialize NSE data collector."""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-            }
+    def __init__(self, cache: Optional["RedisCache"] = None):
+        """Initialize NSE data collector.
+
+        Args:
+            cache: Optional Redis cache shared across processes. Responses are
+                always cached in-process for their endpoint TTL.
+        """
+        self.session = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            headers=HEADERS,
+            limits=CLIENT_LIMITS,
+            timeout=CLIENT_TIMEOUT,
+            follow_redirects=True,
         )
+        self.cache = cache
+        self._chain_cache = TTLCache(maxsize=8, ttl=OPTION_CHAIN_TTL)
+        self._expiry_cache = TTLCache(maxsize=8, ttl=EXPIRY_DATES_TTL)
+        self._cache_lock = threading.Lock()
         self._initialize_session()
 
     def _initialize_session(self):
@@ -45,15 +187,45 @@ class NSEDataCollector:
         """Apply rate limiting delay."""
         time.sleep(settings.nse.rate_limit_delay)
 
+    def _cached(self, local: TTLCache, key: str, serialize: str) -> Optional[Any]:
+        """Look up a value in the in-process cache, then in Redis."""
+        with self._cache_lock:
+            value = local.get(key)
+        if value is None and self.cache is not None:
+            value = self.cache.get(key, serialize=serialize)
+            if value is not None:
+                with self._cache_lock:
+                    local[key] = value
+        return value
+
+    def _store(self, local: TTLCache, key: str, value: Any, serialize: str):
+        """Store a value in the in-process cache and in Redis."""
+        with self._cache_lock:
+            local[key] = value
+        if self.cache is not None:
+            self.cache.set(key, value, expiry=int(local.ttl), serialize=serialize)
+
     def get_option_chain(self, symbol: str = "NIFTY") -> pd.DataFrame:
         """Fetch live option chain from NSE.
 
+        Results are cached for OPTION_CHAIN_TTL seconds, so callers share the
+        returned DataFrame and should copy it before modifying it.
+
         Args:
             symbol: Index symbol (NIFTY, BANKNIFTY, FINNIFTY)
 
         Returns:
             DataFrame with option chain data
         """
+        key = f"option_chain:{symbol}"
+        df = self._cached(self._chain_cache, key, "pickle")
+        if df is None:
+            df = self._fetch_option_chain(symbol)
+            self._store(self._chain_cache, key, df, "pickle")
+        return df
+
+    def _fetch_option_chain(self, symbol: str) -> pd.DataFrame:
+        """Fetch live option chain from NSE, retrying with backoff."""
         url = f"{self.OPTION_CHAIN_URL}?symbol={symbol}"
 
         for attempt in range(settings.nse.max_retries):
@@ -62,46 +234,7 @@ class NSEDataCollector:
                 response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
-                data = response.json()
-                records = data.get("records", {})
-                option_data = records.get("data", [])
-
-                # Parse option chain
-                parsed_data = []
-                for item in option_data:
-                    strike = item.get("strikePrice")
-                    expiry_date = item.get("expiryDate")
-
-                    ce_data = item.get("CE", {})
-                    pe_data = item.get("PE", {})
-
-                    parsed_data.append(
-                        {
-                            "strike": strike,
-                            "expiry_date": expiry_date,
-                            "call_oi": ce_data.get("openInterest", 0),
-                            "call_oi_change": ce_data.get("changeinOpenInterest", 0),
-                            "call_volume": ce_data.get("totalTradedVolume", 0),
-                            "call_iv": ce_data.get("impliedVolatility", 0) / 100,  # Convert to decimal
-                            "call_ltp": ce_data.get("lastPrice", 0),
-                            "call_bid": ce_data.get("bidprice", 0),
-                            "call_ask": ce_data.get("askPrice", 0),
-                            "put_oi": pe_data.get("openInterest", 0),
-                            "put_oi_change": pe_data.get("changeinOpenInterest", 0),
-                            "put_volume": pe_data.get("totalTradedVolume", 0),
-                            "put_iv": pe_data.get("impliedVolatility", 0) / 100,  # Convert to decimal
-                            "put_ltp": pe_data.get("lastPrice", 0),
-                            "put_bid": pe_data.get("bidprice", 0),
-                            "put_ask": pe_data.get("askPrice", 0),
-                        }
-                    )
-
-                df = pd.DataFrame(parsed_data)
-
-                # Store metadata
-                df.attrs["underlying"] = records.get("underlyingValue", 0)
-                df.attrs["timestamp"] = records.get("timestamp", "")
-                df.attrs["symbol"] = symbol
+                df = _parse_option_chain(response.json(), symbol)
 
                 logger.info(f"Fetched option chain for {symbol}: {len(df)} strikes")
                 return df
@@ -122,7 +255,7 @@ class NSEDataCollector:
         Returns:
             India VIX value or None
         """
-        url = f"{self.BASE_URL}/api/equity-stockIndices?index=INDIA VIX"
+        url = INDIA_VIX_URL
 
         try:
             self._rate_limit()
@@ -152,27 +285,57 @@ class NSEDataCollector:
         Returns:
             Path to downloaded file or None
         """
-        date_str = date.strftime("%d%m%y")
-        filename = f"fo{date_str}bhav.csv.zip"
-        url = f"https://www.nseindia.com/content/historical/DERIVATIVES/{date.strftime('%Y/%b').upper()}/{filename}"
+        url = _bhavcopy_url(date)
+        output_path = Path(output_dir) / _bhavcopy_filename(date)
 
-        output_path = Path(output_dir) / filename
+        # Bhavcopies never change once published
+        if output_path.exists():
+            logger.info(f"Bhavcopy for {date.strftime('%Y-%m-%d')} already downloaded")
+            _transcode_bhavcopy(output_path)
+            return output_path
 
         try:
             self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(response.content)
+
+            # Stream to disk instead of buffering the whole archive in memory
+            with self.session.stream("GET", url, timeout=30) as response:
+                response.raise_for_status()
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
 
             logger.info(f"Downloaded Bhavcopy for {date.strftime('%Y-%m-%d')}")
+            _transcode_bhavcopy(output_path)
             return output_path
 
         except Exception as e:
             logger.error(f"Failed to download Bhavcopy for {date.strftime('%Y-%m-%d')}: {e}")
+            output_path.unlink(missing_ok=True)  # Drop any partial file
             return None
 
+    def load_bhavcopy(self, date: datetime, data_dir: str = "data/raw") -> Optional[pd.DataFrame]:
+        """Load the Bhavcopy for a date, preferring the Parquet copy.
+
+        Downloads (and converts) the Bhavcopy first if it is not on disk yet.
+        Readers should use this rather than parsing the CSV.zip themselves.
+
+        Args:
+            date: Bhavcopy date
+            data_dir: Directory holding downloaded Bhavcopies
+
+        Returns:
+            DataFrame with the Bhavcopy or None if unavailable
+        """
+        zip_path = Path(data_dir) / _bhavcopy_filename(date)
+        if not zip_path.exists() and self.download_bhavcopy(date, data_dir) is None:
+            return None
+
+        parquet_path = _transcode_bhavcopy(zip_path)
+        if parquet_path is None:
+            return pd.read_csv(zip_path, compression="zip")
+        return pd.read_parquet(parquet_path)
+
     def get_fii_dii_data(self) -> Optional[Dict]:
         """Fetch FII/DII data.
 
@@ -193,11 +356,210 @@ class NSEDataCollector:
         Returns:
             List of expiry dates
         """
+        key = f"expiry_dates:{symbol}"
+        expiry_dates = self._cached(self._expiry_cache, key, "json")
+        if expiry_dates is not None:
+            return expiry_dates
+
         try:
             df = self.get_option_chain(symbol)
             expiry_dates = sorted(df["expiry_date"].unique().tolist())
             logger.info(f"Found {len(expiry_dates)} expiry dates for {symbol}")
+            self._store(self._expiry_cache, key, expiry_dates, "json")
             return expiry_dates
         except Exception as e:
             logger.error(f"Failed to fetch expiry dates: {e}")
             return []
+
+
+class AsyncNSEDataCollector:
+    """Collect data from NSE India concurrently with httpx.AsyncClient.
+
+    A single client is kept for the lifetime of the collector so NSE cookies
+    persist, and a semaphore bounds the number of in-flight requests.
+
+    Example:
+        async with AsyncNSEDataCollector() as nse:
+            chains = await nse.get_option_chains(["NIFTY", "BANKNIFTY"])
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None):
+        """Initialize async NSE data collector.
+
+        Args:
+            max_concurrent: Maximum concurrent requests (default from settings)
+        """
+        self.CONCURRENCY_LIMIT = max_concurrent or settings.nse.max_concurrent
+        self._sem = asyncio.Semaphore(self.CONCURRENCY_LIMIT)
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=HEADERS,
+            limits=CLIENT_LIMITS,
+            timeout=CLIENT_TIMEOUT,
+            follow_redirects=True,
+        )
+        self._session_lock = asyncio.Lock()
+        self._session_ready = False
+
+    async def __aenter__(self) -> "AsyncNSEDataCollector":
+        await self._initialize_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def _initialize_session(self):
+        """Access NSE homepage once for cookies."""
+        async with self._session_lock:
+            if self._session_ready:
+                return
+            try:
+                await self._client.get(BASE_URL)
+                self._session_ready = True
+                logger.info("Async NSE session initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize async NSE session: {e}")
+
+    async def _get(self, url: str, timeout: float = 10) -> "httpx.Response":
+        """Rate-limited GET bounded by the concurrency semaphore."""
+        await self._initialize_session()
+        async with self._sem:
+            await asyncio.sleep(settings.nse.rate_limit_delay)
+            response = await self._client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    async def get_option_chain(self, symbol: str = "NIFTY") -> pd.DataFrame:
+        """Fetch live option chain from NSE.
+
+        Args:
+            symbol: Index symbol (NIFTY, BANKNIFTY, FINNIFTY)
+
+        Returns:
+            DataFrame with option chain data
+        """
+        url = f"{OPTION_CHAIN_URL}?symbol={symbol}"
+
+        for attempt in range(settings.nse.max_retries):
+            try:
+                response = await self._get(url)
+                df = _parse_option_chain(response.json(), symbol)
+
+                logger.info(f"Fetched option chain for {symbol}: {len(df)} strikes")
+                return df
+
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt < settings.nse.max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"Failed to fetch option chain after {settings.nse.max_retries} attempts")
+                    raise
+
+        return pd.DataFrame()
+
+    async def get_option_chains(self, symbols: List[str]) -> List[pd.DataFrame]:
+        """Fetch option chains for several symbols concurrently.
+
+        Args:
+            symbols: Index symbols to fetch
+
+        Returns:
+            List of option chain DataFrames in the same order as symbols
+        """
+        return await asyncio.gather(*[self.get_option_chain(s) for s in symbols])
+
+    async def get_india_vix(self) -> Optional[float]:
+        """Fetch India VIX value.
+
+        Returns:
+            India VIX value or None
+        """
+        try:
+            response = await self._get(INDIA_VIX_URL)
+            vix_data = response.json().get("data", [])
+
+            if vix_data:
+                vix = vix_data[0].get("last", 0)
+                logger.info(f"India VIX: {vix}")
+                return vix
+
+        except Exception as e:
+            logger.error(f"Failed to fetch India VIX: {e}")
+
+        return None
+
+    async def download_bhavcopy(self, date: datetime, output_dir: str = "data/raw") -> Optional[Path]:
+        """Download NSE Bhavcopy for a specific date.
+
+        Args:
+            date: Date for which to download Bhavcopy
+            output_dir: Directory to save the file
+
+        Returns:
+            Path to downloaded file or None
+        """
+        url = _bhavcopy_url(date)
+        output_path = Path(output_dir) / _bhavcopy_filename(date)
+
+        # Bhavcopies never change once published
+        if output_path.exists():
+            logger.info(f"Bhavcopy for {date.strftime('%Y-%m-%d')} already downloaded")
+            await asyncio.to_thread(_transcode_bhavcopy, output_path)
+            return output_path
+
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            await self._initialize_session()
+            async with self._sem:
+                await asyncio.sleep(settings.nse.rate_limit_delay)
+                async with self._client.stream("GET", url, timeout=30) as response:
+                    response.raise_for_status()
+                    with open(output_path, "wb") as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+
+            logger.info(f"Downloaded Bhavcopy for {date.strftime('%Y-%m-%d')}")
+            await asyncio.to_thread(_transcode_bhavcopy, output_path)
+            return output_path
+
+        except Exception as e:
+            logger.error(f"Failed to download Bhavcopy for {date.strftime('%Y-%m-%d')}: {e}")
+            output_path.unlink(missing_ok=True)  # Drop any partial file
+            return None
+
+    async def download_bhavcopies(
+        self, dates: List[datetime], output_dir: str = "data/raw"
+    ) -> List[Optional[Path]]:
+        """Download Bhavcopies for several dates concurrently.
+
+        Concurrency is bounded by the collector's semaphore, and each file is
+        streamed to disk so parallel downloads don't add up in memory.
+
+        Args:
+            dates: Dates for which to download Bhavcopies
+            output_dir: Directory to save the files
+
+        Returns:
+            Paths to the downloaded files (None for failed dates), in the
+            same order as dates
+        """
+        results = await asyncio.gather(
+            *[self.download_bhavcopy(date, output_dir) for date in dates],
+            return_exceptions=True,
+        )
+
+        paths = []
+        for date, result in zip(dates, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to download Bhavcopy for {date.strftime('%Y-%m-%d')}: {result}")
+                result = None
+            paths.append(result)
+
+        logger.info(f"Downloaded {sum(p is not None for p in paths)}/{len(dates)} Bhavcopies")
+        return paths
@@ -2,12 +2,15 @@
 
 import json
 import pickle
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 from datetime import timedelta
 
 from config.settings import settings
 from config.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
 # Try to import redis
@@ -18,6 +21,101 @@ except ImportError:
     logger.warning("redis-py not installed. Caching features will be unavailable.")
     REDIS_AVAILABLE = False
 
+# Try to import orjson (falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import pyarrow (needed for the 'arrow' serializer only)
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import lz4 (compresses pickled values when available)
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+PICKLE_PROTOCOL = 5
+LZ4_MAGIC = b"L4"  # Pickle streams always start with b"\x80", so this can't clash
+SERIALIZERS = ("json", "pickle", "arrow")
+SCAN_BATCH_SIZE = 1000
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when available.
+
+    Non-str dict keys are written as strings, as the json module does. One
+    difference remains: orjson writes NaN and inf as null (valid JSON)
+    where json writes the non-standard NaN/Infinity tokens, so they read
+    back as None.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(value).encode()
+
+
+def _json_loads(value: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _pickle_dumps(value: Any) -> bytes:
+    """Pickle a value, lz4-compressing it when lz4 is available."""
+    raw = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+    if LZ4_AVAILABLE:
+        return LZ4_MAGIC + lz4.frame.compress(raw, compression_level=1)
+    return raw
+
+
+def _pickle_loads(value: bytes) -> Any:
+    """Unpickle a value written by _pickle_dumps (compressed or not)."""
+    if value.startswith(LZ4_MAGIC):
+        if not LZ4_AVAILABLE:
+            raise ImportError("lz4 is required to read compressed cache entries")
+        value = lz4.frame.decompress(value[len(LZ4_MAGIC):])
+    return pickle.loads(value)
+
+
+def _arrow_dumps(df: "pd.DataFrame") -> bytes:
+    """Serialize a DataFrame as an Arrow IPC stream."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for serialize='arrow'")
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _arrow_loads(value: bytes) -> "pd.DataFrame":
+    """Deserialize an Arrow IPC stream back into a DataFrame."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for serialize='arrow'")
+    return pa.ipc.open_stream(value).read_all().to_pandas()
+
+
+def _deserialize(value: bytes, serialize: str) -> Any:
+    """Decode a raw cached value with the given serialization method."""
+    if serialize == "json":
+        return _json_loads(value)
+    elif serialize == "pickle":
+        return _pickle_loads(value)
+    elif serialize == "arrow":
+        return _arrow_loads(value)
+    else:
+        raise ValueError(f"serialize must be one of {SERIALIZERS}")
+
 
 class RedisCache:
     """Redis cache wrapper for real-time data."""
@@ -53,7 +151,7 @@ class RedisCache:
             key: Cache key
             value: Value to cache
             expiry: Expiry time in seconds
-            serialize: Serialization method ('json' or 'pickle')
+            serialize: Serialization method ('json', 'pickle' or 'arrow')
 
         Returns:
             True if successful
@@ -63,11 +161,13 @@ class RedisCache:
 
         try:
             if serialize == "json":
-                serialized_value = json.dumps(value)
+                serialized_value = _json_dumps(value)
             elif serialize == "pickle":
-                serialized_value = pickle.dumps(value)
+                serialized_value = _pickle_dumps(value)
+            elif serialize == "arrow":
+                serialized_value = _arrow_dumps(value)
             else:
-                raise ValueError("serialize must be 'json' or 'pickle'")
+                raise ValueError(f"serialize must be one of {SERIALIZERS}")
 
             if expiry:
                 self.client.setex(key, expiry, serialized_value)
@@ -84,7 +184,7 @@ class RedisCache:
 
         Args:
             key: Cache key
-            serialize: Serialization method used ('json' or 'pickle')
+            serialize: Serialization method used ('json', 'pickle' or 'arrow')
 
         Returns:
             Cached value or None
@@ -97,17 +197,35 @@ class RedisCache:
             if value is None:
                 return None
 
-            if serialize == "json":
-                return json.loads(value)
-            elif serialize == "pickle":
-                return pickle.loads(value)
-            else:
-                raise ValueError("serialize must be 'json' or 'pickle'")
+            return _deserialize(value, serialize)
 
         except Exception as e:
             logger.error(f"Failed to get cache key {key}: {e}")
             return None
 
+    def mget(self, keys: List[str], serialize: str = "json") -> List[Optional[Any]]:
+        """Get several values from cache in a single MGET round trip.
+
+        Args:
+            keys: Cache keys
+            serialize: Serialization method used ('json', 'pickle' or 'arrow')
+
+        Returns:
+            Cached values in the same order as keys (None for missing keys)
+        """
+        if not self.client or not keys:
+            return [None] * len(keys)
+
+        try:
+            values = self.client.mget(keys)
+            return [
+                None if value is None else _deserialize(value, serialize)
+                for value in values
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get cache keys {keys}: {e}")
+            return [None] * len(keys)
+
     def delete(self, key: str) -> bool:
         """Delete a key from cache.
 
@@ -158,10 +276,17 @@ class RedisCache:
             return 0
 
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                return self.client.delete(*keys)
-            return 0
+            # SCAN instead of KEYS so Redis is never blocked on a full keyspace walk
+            deleted = 0
+            with self.client.pipeline(transaction=False) as pipe:
+                for i, key in enumerate(
+                    self.client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE), 1
+                ):
+                    pipe.delete(key)
+                    if i % SCAN_BATCH_SIZE == 0:
+                        deleted += sum(pipe.execute())
+                deleted += sum(pipe.execute())
+            return deleted
         except Exception as e:
             logger.error(f"Failed to clear pattern {pattern}: {e}")
             return 0
@@ -1,11 +1,40 @@
 """Database connection and management."""
 
-from contextlib import contextmanager
+import importlib.util
+from contextlib import asynccontextmanager, contextmanager
 from config.settings import settings
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+__all__ = [
+    "Base",
+    "engine",
+    "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
+    "init_db",
+    "get_db",
+    "get_db_session",
+    "get_async_db",
+]
+
+
+def _async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def _connect_args(url: str) -> dict:
+    """libpq TCP keepalive settings for PostgreSQL URLs."""
+    if url.startswith(("postgresql", "postgres://")):
+        return {"keepalives": 1, "keepalives_idle": 30}
+    return {}
+
+
 # Try to import SQLAlchemy
 try:
     from sqlalchemy import create_engine
@@ -20,23 +49,55 @@ except ImportError:
     engine = None
     SessionLocal = None
 
+# Async engine needs SQLAlchemy's asyncio extension and the asyncpg driver
+ASYNC_DB_AVAILABLE = SQLALCHEMY_AVAILABLE and importlib.util.find_spec("asyncpg") is not None
+async_engine = None
+AsyncSessionLocal = None
+
 if SQLALCHEMY_AVAILABLE:
     # Create SQLAlchemy Base
     Base = declarative_base()
 
     # Create engine
+    # Recycle connections and rely on TCP keepalives instead of a
+    # SELECT 1 pre-ping on every checkout
     engine = create_engine(
         settings.database.database_url,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
-        pool_pre_ping=True,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        pool_recycle=settings.database.pool_recycle,
+        pool_pre_ping=False,
+        connect_args=_connect_args(settings.database.database_url),
         echo=False,
     )
 
     # Create session factory
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if ASYNC_DB_AVAILABLE:
+    try:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        # Create async engine (asyncpg driver) with its own, smaller pool;
+        # both pools count against the same server connection limit.
+        # The libpq keepalives above do not apply to asyncpg, so dropped
+        # connections are caught with a pre-ping on checkout
+        async_engine = create_async_engine(
+            _async_database_url(settings.database.database_url),
+            pool_size=settings.database.async_pool_size,
+            max_overflow=settings.database.async_max_overflow,
+            pool_recycle=settings.database.pool_recycle,
+            pool_pre_ping=True,
+            echo=False,
+        )
+
+        # Create async session factory
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+    except Exception as e:
+        logger.warning(f"Async database engine unavailable: {e}")
+        ASYNC_DB_AVAILABLE = False
+
 
 def init_db():
     """Initialize database tables."""
@@ -90,3 +151,27 @@ def get_db_session():
         return None
     
     return SessionLocal()
+
+
+@asynccontextmanager
+async def get_async_db():
+    """Get async database session context manager.
+
+    Usage:
+        async with get_async_db() as db:
+            # Use db session
+            pass
+    """
+    if not ASYNC_DB_AVAILABLE:
+        logger.error("Async database driver not available. Cannot create database session.")
+        yield None
+        return
+
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Database error: {e}")
+            raise
@@ -0,0 +1,156 @@
+"""Compiled Black-Scholes kernels for batch Greeks calculation."""
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import numba (falls back to NumPy expressions)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.warning("numba not installed. Greeks kernels will use NumPy.")
+    NUMBA_AVAILABLE = False
+
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+SQRT2 = math.sqrt(2.0)
+
+
+def _bs_gamma_batch_numpy(
+    spot: float,
+    log_sk: np.ndarray,
+    t: float,
+    sqrt_t: float,
+    r: float,
+    vols: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """NumPy implementation of bs_gamma_batch."""
+    vol_sqrt_t = vols * sqrt_t
+    d1 = (log_sk + (r + 0.5 * vols * vols) * t) / vol_sqrt_t
+    np.multiply(np.exp(-0.5 * d1 * d1), INV_SQRT_2PI / spot, out=out)
+    np.divide(out, vol_sqrt_t, out=out)
+    return out
+
+
+def _greeks_batch_numpy(
+    spot: float,
+    strikes: np.ndarray,
+    log_sk: np.ndarray,
+    t: float,
+    sqrt_t: float,
+    r: float,
+    disc: float,
+    vols: np.ndarray,
+    w: np.ndarray,
+    out_price: np.ndarray,
+    out_delta: np.ndarray,
+    out_gamma: np.ndarray,
+    out_theta: np.ndarray,
+    out_vega: np.ndarray,
+    out_rho: np.ndarray,
+) -> None:
+    """NumPy implementation of greeks_batch."""
+    vol_sqrt_t = vols * sqrt_t
+    d1 = (log_sk + (r + 0.5 * vols * vols) * t) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    pdf_d1 = INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    cdf_d1 = ndtr(w * d1)
+    w_k_cdf_d2 = w * strikes * disc * ndtr(w * d2)
+
+    out_price[:] = w * spot * cdf_d1 - w_k_cdf_d2
+    out_delta[:] = w * cdf_d1
+    out_gamma[:] = pdf_d1 / (spot * vol_sqrt_t)
+    out_theta[:] = (-spot * pdf_d1 * vols / (2 * sqrt_t) - r * w_k_cdf_d2) / 365
+    out_vega[:] = spot * pdf_d1 * sqrt_t / 100
+    out_rho[:] = t * w_k_cdf_d2 / 100
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True, error_model="numpy")
+    def bs_gamma_batch(spot, log_sk, t, sqrt_t, r, vols, out):
+        """Black-Scholes gamma for each strike, written into out.
+
+        The loop has no branches, so vols must already be positive and finite
+        (callers mask invalid rows afterwards). Constants are cast to the
+        dtype of vols, so float32 inputs are computed in float32.
+
+        Args:
+            spot: Current spot price
+            log_sk: Array of log(spot / strike)
+            t: Time to expiry in years
+            sqrt_t: sqrt(t)
+            r: Risk-free rate
+            vols: Array of implied volatilities
+            out: Preallocated output array
+
+        Returns:
+            out
+        """
+        half = vols.dtype.type(0.5)
+        inv_sqrt_2pi = vols.dtype.type(INV_SQRT_2PI)
+        for i in numba.prange(log_sk.shape[0]):
+            vol = vols[i]
+            vol_sqrt_t = vol * sqrt_t
+            d1 = (log_sk[i] + (r + half * vol * vol) * t) / vol_sqrt_t
+            out[i] = math.exp(-half * d1 * d1) * inv_sqrt_2pi / (spot * vol_sqrt_t)
+        return out
+
+    @numba.njit(parallel=True, fastmath=True, cache=True, error_model="numpy")
+    def greeks_batch(
+        spot, strikes, log_sk, t, sqrt_t, r, disc, vols, w,
+        out_price, out_delta, out_gamma, out_theta, out_vega, out_rho,
+    ):
+        """All Black-Scholes Greeks for each strike, written into the outputs.
+
+        Strikes are independent, so the loop runs across threads (sized by
+        NUMBA_NUM_THREADS or numba.set_num_threads). Calls and puts share
+        one branchless formula through the sign w (+1 call, -1 put).
+        Constants are cast to the dtype of vols, so float32 inputs are
+        computed in float32.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            log_sk: Array of log(spot / strike)
+            t: Time to expiry in years
+            sqrt_t: sqrt(t)
+            r: Risk-free rate
+            disc: Discount factor exp(-r * t)
+            vols: Array of implied volatilities
+            w: Array of +1.0 for calls and -1.0 for puts
+            out_price, out_delta, out_gamma, out_theta, out_vega, out_rho:
+                Preallocated output arrays (theta daily, vega/rho per 1%)
+        """
+        half = vols.dtype.type(0.5)
+        inv_sqrt_2pi = vols.dtype.type(INV_SQRT_2PI)
+        sqrt2 = vols.dtype.type(SQRT2)
+        two_sqrt_t = sqrt_t + sqrt_t
+        days = vols.dtype.type(365)
+        pct = vols.dtype.type(100)
+        for i in numba.prange(strikes.shape[0]):
+            vol = vols[i]
+            wi = w[i]
+            vol_sqrt_t = vol * sqrt_t
+            d1 = (log_sk[i] + (r + half * vol * vol) * t) / vol_sqrt_t
+            d2 = d1 - vol_sqrt_t
+            pdf_d1 = inv_sqrt_2pi * math.exp(-half * d1 * d1)
+            cdf_d1 = half * math.erfc(-wi * d1 / sqrt2)
+            w_k_cdf_d2 = wi * strikes[i] * disc * half * math.erfc(-wi * d2 / sqrt2)
+
+            out_price[i] = wi * spot * cdf_d1 - w_k_cdf_d2
+            out_delta[i] = wi * cdf_d1
+            out_gamma[i] = pdf_d1 / (spot * vol_sqrt_t)
+            out_theta[i] = (-spot * pdf_d1 * vol / two_sqrt_t - r * w_k_cdf_d2) / days
+            out_vega[i] = spot * pdf_d1 * sqrt_t / pct
+            out_rho[i] = t * w_k_cdf_d2 / pct
+
+else:
+    bs_gamma_batch = _bs_gamma_batch_numpy
+    greeks_batch = _greeks_batch_numpy
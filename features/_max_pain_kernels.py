@@ -0,0 +1,102 @@
+"""Compiled kernels for the Max Pain curve."""
+
+from typing import Tuple
+
+import numpy as np
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import numba (falls back to NumPy prefix sums)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.warning("numba not installed. Max Pain kernel will use NumPy.")
+    NUMBA_AVAILABLE = False
+
+
+def _pain_curve_numpy(
+    strikes: np.ndarray,
+    call_oi: np.ndarray,
+    put_oi: np.ndarray,
+    lot_size: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NumPy implementation of pain_curve."""
+    # Prefix sums (with a leading 0) of OI and strike-weighted OI
+    cum_call = np.concatenate(([0.0], np.cumsum(call_oi)))
+    cum_kcall = np.concatenate(([0.0], np.cumsum(strikes * call_oi)))
+    cum_put = np.concatenate(([0.0], np.cumsum(put_oi)))
+    cum_kput = np.concatenate(([0.0], np.cumsum(strikes * put_oi)))
+
+    # below: strikes < settlement, above: strikes > settlement
+    below = np.searchsorted(strikes, strikes, side="left")
+    above = np.searchsorted(strikes, strikes, side="right")
+
+    # Call writers lose on ITM calls: sum((S - K) * call_oi) for K < S
+    call_loss = (strikes * cum_call[below] - cum_kcall[below]) * lot_size
+
+    # Put writers lose on ITM puts: sum((K - S) * put_oi) for K > S
+    put_above = cum_put[-1] - cum_put[above]
+    kput_above = cum_kput[-1] - cum_kput[above]
+    put_loss = (kput_above - strikes * put_above) * lot_size
+
+    return call_loss, put_loss
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)
+    def pain_curve(strikes, call_oi, put_oi, lot_size):
+        """Option writer losses with settlement at each strike.
+
+        Args:
+            strikes: Strike prices sorted ascending
+            call_oi: Call open interest per strike
+            put_oi: Put open interest per strike
+            lot_size: Contract lot size
+
+        Returns:
+            Tuple of (call_loss, put_loss) arrays
+        """
+        n = strikes.shape[0]
+        call_loss = np.empty(n)
+        put_loss = np.empty(n)
+
+        # Forward scan: running call OI sums over strikes strictly below
+        oi_below = 0.0
+        k_oi_below = 0.0
+        i = 0
+        while i < n:
+            k = strikes[i]
+            j = i
+            while j < n and strikes[j] == k:
+                j += 1
+            loss = (k * oi_below - k_oi_below) * lot_size
+            for m in range(i, j):
+                call_loss[m] = loss
+                oi_below += call_oi[m]
+                k_oi_below += k * call_oi[m]
+            i = j
+
+        # Reverse scan: running put OI sums over strikes strictly above
+        oi_above = 0.0
+        k_oi_above = 0.0
+        i = n - 1
+        while i >= 0:
+            k = strikes[i]
+            j = i
+            while j >= 0 and strikes[j] == k:
+                j -= 1
+            loss = (k_oi_above - k * oi_above) * lot_size
+            for m in range(i, j, -1):
+                put_loss[m] = loss
+                oi_above += put_oi[m]
+                k_oi_above += k * put_oi[m]
+            i = j
+
+        return call_loss, put_loss
+
+else:
+    pain_curve = _pain_curve_numpy
@@ -0,0 +1,109 @@
+"""Columnar (struct-of-arrays) snapshot of an option chain."""
+
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ChainArrays(NamedTuple):
+    """Option chain columns as contiguous float64 arrays.
+
+    Missing columns are filled with zeros and NaNs are replaced by zero, so
+    calculators can work on the arrays directly.
+    """
+
+    strike: np.ndarray
+    call_oi: np.ndarray
+    put_oi: np.ndarray
+    call_ltp: np.ndarray
+    put_ltp: np.ndarray
+    call_iv: np.ndarray
+    put_iv: np.ndarray
+    call_volume: np.ndarray
+    put_volume: np.ndarray
+
+
+def _column(option_chain: "pd.DataFrame", name: str) -> np.ndarray:
+    """Extract a column as a contiguous NaN-free float64 array."""
+    if name not in option_chain:
+        return np.zeros(len(option_chain), dtype=np.float64)
+    values = option_chain[name].to_numpy(dtype=np.float64, na_value=0.0)
+    return np.ascontiguousarray(values)
+
+
+def to_chain_arrays(option_chain: "pd.DataFrame") -> ChainArrays:
+    """Convert an option chain DataFrame to a ChainArrays snapshot.
+
+    Args:
+        option_chain: DataFrame with at least a strike column
+
+    Returns:
+        ChainArrays with one array per column
+    """
+    return ChainArrays(
+        **{field: _column(option_chain, field) for field in ChainArrays._fields}
+    )
+
+
+def chain_column(
+    option_chain: Union["pd.DataFrame", ChainArrays], name: str
+) -> np.ndarray:
+    """Return one cleaned column from a DataFrame or ChainArrays.
+
+    Lets calculators that need only a few columns accept either form
+    without converting the whole DataFrame.
+
+    Args:
+        option_chain: Option chain DataFrame or an existing ChainArrays
+        name: ChainArrays field name
+
+    Returns:
+        Contiguous NaN-free float64 array
+    """
+    if isinstance(option_chain, ChainArrays):
+        return getattr(option_chain, name)
+    return _column(option_chain, name)
+
+
+def as_chain_arrays(option_chain: Union["pd.DataFrame", ChainArrays]) -> ChainArrays:
+    """Return the chain as ChainArrays, converting a DataFrame if needed.
+
+    Args:
+        option_chain: Option chain DataFrame or an existing ChainArrays
+
+    Returns:
+        ChainArrays snapshot
+    """
+    if isinstance(option_chain, ChainArrays):
+        return option_chain
+    return to_chain_arrays(option_chain)
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first.
+
+    Uses an O(N) partition and only sorts the selected slice. NaNs rank
+    below every number, matching ``sort_values(ascending=False)``.
+
+    Args:
+        values: 1-D array of values
+        k: Number of indices to return
+
+    Returns:
+        Integer index array of length min(k, len(values))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[0]
+    k = min(max(int(k), 0), n)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    keys = np.where(np.isnan(values), -np.inf, values)
+    if k < n:
+        idx = np.argpartition(keys, n - k)[n - k:]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-keys[idx], kind="stable")]
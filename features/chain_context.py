@@ -0,0 +1,69 @@
+"""Volatility-independent Black-Scholes terms shared across a chain snapshot."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ChainContext:
+    """Precomputed terms for one spot, expiry and strike array.
+
+    Every per-strike Greek needs log(S/K), sqrt(T) and exp(-rT). Building
+    them once lets the Greeks and GEX calculators share the same values
+    instead of each recomputing them. All arrays and scalars use the
+    context's dtype.
+    """
+
+    spot: float
+    strikes: np.ndarray
+    time_to_expiry: float
+    risk_free_rate: float
+    log_sk: np.ndarray
+    sqrt_t: float
+    disc: float
+
+    @classmethod
+    def build(
+        cls,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        risk_free_rate: float,
+        dtype: np.dtype = np.float64,
+    ) -> "ChainContext":
+        """Compute the shared terms for a chain.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            risk_free_rate: Annual risk-free interest rate
+            dtype: Floating point dtype of the context
+
+        Returns:
+            ChainContext for the given inputs
+        """
+        if time_to_expiry <= 0:
+            raise ValueError("Time to expiry must be positive")
+
+        scalar = np.dtype(dtype).type
+        spot = scalar(spot)
+        time_to_expiry = scalar(time_to_expiry)
+        risk_free_rate = scalar(risk_free_rate)
+        strikes = np.ascontiguousarray(strikes, dtype=dtype)
+
+        return cls(
+            spot=spot,
+            strikes=strikes,
+            time_to_expiry=time_to_expiry,
+            risk_free_rate=risk_free_rate,
+            log_sk=np.log(spot / strikes),
+            sqrt_t=np.sqrt(time_to_expiry),
+            disc=np.exp(-risk_free_rate * time_to_expiry),
+        )
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating point dtype of the context arrays."""
+        return self.strikes.dtype
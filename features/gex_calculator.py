@@ -2,10 +2,12 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from config.constants import GEX_MULTIPLIER
 from config.logging_config import get_logger
+from features.chain_arrays import ChainArrays, as_chain_arrays
+from features.chain_context import ChainContext
 from features.greeks_calculator import GreeksCalculator
 
 logger = get_logger(__name__)
@@ -58,83 +60,85 @@ class GammaExposureCalculator:
 
     def calculate_chain_gex(
         self,
-        option_chain: pd.DataFrame,
+        option_chain: Union[pd.DataFrame, ChainArrays],
         spot: float,
         days_to_expiry: int,
         lot_size: int = 50,
+        context: Optional[ChainContext] = None,
     ) -> pd.DataFrame:
         """Calculate GEX for entire option chain.
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi, call_iv, put_iv
+                (or a ChainArrays snapshot)
             spot: Current spot price
             days_to_expiry: Days until expiry
             lot_size: Contract lot size (default 50 for NIFTY)
+            context: Optional ChainContext for the same strikes, spot and
+                expiry, to reuse terms already computed elsewhere
 
         Returns:
             DataFrame with GEX calculations for each strike
+
+        Raises:
+            ValueError: If context does not match the chain's strikes, spot
+                or days_to_expiry
         """
         time_to_expiry = days_to_expiry / 365.0
 
-        results = []
-
-        for _, row in option_chain.iterrows():
-            strike = row["strike"]
+        chain = as_chain_arrays(option_chain)
 
-            # Calculate gamma for calls
-            if pd.notna(row.get("call_iv")) and row.get("call_iv", 0) > 0:
-                call_greeks = self.greeks_calculator.calculate_greeks(
-                    spot=spot,
-                    strike=strike,
-                    time_to_expiry=time_to_expiry,
-                    volatility=row["call_iv"],
-                    option_type="call",
-                )
-                call_gamma = call_greeks.gamma
-            else:
-                call_gamma = 0
-
-            # Calculate gamma for puts
-            if pd.notna(row.get("put_iv")) and row.get("put_iv", 0) > 0:
-                put_greeks = self.greeks_calculator.calculate_greeks(
-                    spot=spot,
-                    strike=strike,
-                    time_to_expiry=time_to_expiry,
-                    volatility=row["put_iv"],
-                    option_type="put",
+        if context is not None:
+            # The gamma kernel indexes without bounds checks, so a context
+            # for another strike list must be rejected up front
+            if context.strikes.shape != chain.strike.shape:
+                raise ValueError(
+                    f"context has {context.strikes.shape[0]} strikes, "
+                    f"chain has {chain.strike.shape[0]}"
                 )
-                put_gamma = put_greeks.gamma
-            else:
-                put_gamma = 0
-
-            # Calculate GEX
-            gex = self.calculate_strike_gex(
-                spot=spot,
-                strike=strike,
-                call_oi=row.get("call_oi", 0),
-                put_oi=row.get("put_oi", 0),
-                call_gamma=call_gamma,
-                put_gamma=put_gamma,
-                lot_size=lot_size,
+            if not np.isclose(context.spot, spot, rtol=1e-6):
+                raise ValueError("context spot does not match spot")
+            if not np.isclose(context.time_to_expiry, time_to_expiry, rtol=1e-6):
+                raise ValueError("context time to expiry does not match days_to_expiry")
+
+        # OI is integral; gamma/GEX in single precision halves memory traffic
+        call_oi = chain.call_oi.astype(np.int64)
+        put_oi = chain.put_oi.astype(np.int64)
+
+        # Both sides share log(S/K) and sqrt(T) from one context
+        if context is None:
+            context = self.greeks_calculator.chain_context(
+                spot, chain.strike, time_to_expiry, dtype=np.float32
             )
 
-            results.append(
-                {
-                    "strike": strike,
-                    "call_oi": row.get("call_oi", 0),
-                    "put_oi": row.get("put_oi", 0),
-                    "call_gamma": call_gamma,
-                    "put_gamma": put_gamma,
-                    "call_gex": gex["call_gex"],
-                    "put_gex": gex["put_gex"],
-                    "net_gex": gex["net_gex"],
-                }
-            )
-
-        gex_df = pd.DataFrame(results)
+        # Gamma for every strike in one vectorized pass per side
+        n = len(chain.strike)
+        call_gamma = self.greeks_calculator.gamma_from_context(
+            context, chain.call_iv, out=np.empty(n, dtype=np.float32)
+        )
+        put_gamma = self.greeks_calculator.gamma_from_context(
+            context, chain.put_iv, out=np.empty(n, dtype=np.float32)
+        )
+
+        # GEX = Gamma × OI × Lot Size × Spot² × 0.01 (puts negative)
+        scale = np.float32(lot_size * spot * spot * GEX_MULTIPLIER)
+        call_gex = call_gamma * call_oi.astype(np.float32) * scale
+        put_gex = -put_gamma * put_oi.astype(np.float32) * scale
+        net_gex = call_gex + put_gex
 
-        # Add cumulative GEX
-        gex_df["cumulative_gex"] = gex_df["net_gex"].cumsum()
+        gex_df = pd.DataFrame(
+            {
+                "strike": chain.strike,
+                "call_oi": call_oi,
+                "put_oi": put_oi,
+                "call_gamma": call_gamma,
+                "put_gamma": put_gamma,
+                "call_gex": call_gex,
+                "put_gex": put_gex,
+                "net_gex": net_gex,
+                "cumulative_gex": np.cumsum(net_gex),
+            }
+        )
 
         return gex_df
 
@@ -144,39 +148,36 @@ class GammaExposureCalculator:
         """Find key GEX levels (flip levels, max GEX strikes).
 
         Args:
-            gex_df: DataFrame from calculate_chain_gex
+            gex_df: DataFrame from calculate_chain_gex, sorted by strike
+                (calculate_chain_gex keeps chain order, and the NSE and
+                dashboard chains are sorted)
             spot: Current spot price
 
         Returns:
             Dictionary with key GEX levels and regime information
         """
-        # Find zero gamma (flip) level
-        # This is where net GEX crosses zero
-        zero_crossings = []
-        for i in range(len(gex_df) - 1):
-            if (gex_df.iloc[i]["net_gex"] * gex_df.iloc[i + 1]["net_gex"]) < 0:
-                # Linear interpolation to find exact crossing
-                strike1 = gex_df.iloc[i]["strike"]
-                strike2 = gex_df.iloc[i + 1]["strike"]
-                gex1 = gex_df.iloc[i]["net_gex"]
-                gex2 = gex_df.iloc[i + 1]["net_gex"]
-
-                flip_level = strike1 + (strike2 - strike1) * abs(gex1) / (
-                    abs(gex1) + abs(gex2)
-                )
-                zero_crossings.append(flip_level)
+        strikes = gex_df["strike"].to_numpy()
+        g = gex_df["net_gex"].to_numpy()
 
-        # Find max absolute GEX strikes
-        max_positive_gex_idx = gex_df["net_gex"].idxmax()
-        max_negative_gex_idx = gex_df["net_gex"].idxmin()
+        # Find zero gamma (flip) level
+        # This is where net GEX changes sign between adjacent strikes
+        idx = np.flatnonzero(np.sign(g[:-1]) * np.sign(g[1:]) < 0)
 
-        max_positive_gex_strike = gex_df.loc[max_positive_gex_idx, "strike"]
-        max_negative_gex_strike = gex_df.loc[max_negative_gex_idx, "strike"]
+        # Linear interpolation to find exact crossing
+        g1 = np.abs(g[idx])
+        g2 = np.abs(g[idx + 1])
+        flip = strikes[idx] + (strikes[idx + 1] - strikes[idx]) * g1 / (g1 + g2)
+        zero_crossings = flip.tolist()
 
-        # Calculate total GEX above and below spot
-        above_spot = gex_df[gex_df["strike"] > spot]["net_gex"].sum()
-        below_spot = gex_df[gex_df["strike"] < spot]["net_gex"].sum()
-        total_gex = gex_df["net_gex"].sum()
+        # Find max absolute GEX strikes
+        max_positive_gex_strike = strikes[np.argmax(g)]
+        max_negative_gex_strike = strikes[np.argmin(g)]
+
+        # Calculate total GEX above and below spot (strikes at spot count in
+        # neither); strikes are sorted, so binary search splits the chain
+        below_spot = g[: np.searchsorted(strikes, spot, side="left")].sum()
+        above_spot = g[np.searchsorted(strikes, spot, side="right"):].sum()
+        total_gex = g.sum()
 
         # Determine GEX regime
         if total_gex > 0:
@@ -1,14 +1,153 @@
 """Black-Scholes Greeks calculator."""
 
+import math
 import numpy as np
 from dataclasses import dataclass
-from typing import Optional
-from scipy.stats import norm
+from functools import lru_cache
+from typing import Dict, Optional, Union
+from scipy.optimize import brentq
+from scipy.special import ndtr
 
 from config.logging_config import get_logger
+from features._greeks_kernels import INV_SQRT_2PI, bs_gamma_batch, greeks_batch
+from features.chain_context import ChainContext
 
 logger = get_logger(__name__)
 
+SQRT2 = math.sqrt(2.0)
+
+# Search bracket for implied volatility
+IV_LOWER_BOUND = 1e-4
+IV_UPPER_BOUND = 5.0
+IV_BRACKET_TOLERANCE = 1e-12
+
+# Keys (and kernel output order) of the vectorized Greeks dictionaries
+GREEK_NAMES = ("price", "delta", "gamma", "theta", "vega", "rho")
+
+# Distinct (spot, strike, T, vol, r, type) tuples kept by the scalar cache
+GREEKS_CACHE_SIZE = 4096
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF for a scalar (erfc form stays accurate in the tails)."""
+    return 0.5 * math.erfc(-x / SQRT2)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal PDF for a scalar."""
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+@lru_cache(maxsize=GREEKS_CACHE_SIZE)
+def _greeks_core(
+    spot: float,
+    strike: float,
+    time_to_expiry: float,
+    volatility: float,
+    r: float,
+    is_call: bool,
+) -> tuple[float, float, float, float, float, float]:
+    """Memoized scalar Black-Scholes Greeks.
+
+    The risk-free rate is part of the key, so changing it on a calculator
+    never returns stale values. lru_cache keeps its own bookkeeping
+    consistent across threads, but two threads missing on the same key may
+    both compute it.
+
+    A non-positive or missing volatility (expired or no-bid rows) gives the
+    zero-volatility limit: the discounted intrinsic value, with zero gamma
+    and vega.
+
+    Args:
+        spot: Current spot price
+        strike: Strike price
+        time_to_expiry: Time to expiry in years (positive)
+        volatility: Implied volatility
+        r: Annual risk-free interest rate
+        is_call: True for a call, False for a put
+
+    Returns:
+        Tuple of (price, delta, gamma, theta, vega, rho)
+    """
+    # Shared terms, each evaluated once
+    sqrt_t = math.sqrt(time_to_expiry)
+    disc = math.exp(-r * time_to_expiry)
+    log_sk = math.log(spot / strike)
+    k_disc = strike * disc
+
+    if not volatility > 0:
+        # d1 and d2 tend to +/-inf with the sign of log(S/K) + rT
+        w = 1.0 if is_call else -1.0
+        moneyness = w * (log_sk + r * time_to_expiry)
+        cdf = 0.5 if moneyness == 0 else float(moneyness > 0)
+        w_k_cdf = w * k_disc * cdf
+        return (
+            w * spot * cdf - w_k_cdf,
+            w * cdf,
+            0.0,
+            -r * w_k_cdf / 365,
+            0.0,
+            time_to_expiry * w_k_cdf / 100,
+        )
+
+    vol_sqrt_t = volatility * sqrt_t
+
+    d1 = (log_sk + (r + 0.5 * volatility**2) * time_to_expiry) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    pdf_d1 = _norm_pdf(d1)
+
+    # Time decay common to calls and puts
+    decay = -spot * pdf_d1 * volatility / (2 * sqrt_t)
+
+    if is_call:
+        cdf_d1 = _norm_cdf(d1)
+        cdf_d2 = _norm_cdf(d2)
+        price = spot * cdf_d1 - k_disc * cdf_d2
+        delta = cdf_d1
+        theta = (decay - r * k_disc * cdf_d2) / 365
+        rho = time_to_expiry * k_disc * cdf_d2 / 100
+    else:
+        cdf_d1 = _norm_cdf(-d1)
+        cdf_d2 = _norm_cdf(-d2)
+        price = k_disc * cdf_d2 - spot * cdf_d1
+        delta = -cdf_d1
+        theta = (decay + r * k_disc * cdf_d2) / 365
+        rho = -time_to_expiry * k_disc * cdf_d2 / 100
+
+    # Gamma is the same for calls and puts; vega is per 1% volatility
+    gamma = pdf_d1 / (spot * vol_sqrt_t)
+    vega = spot * pdf_d1 * sqrt_t / 100
+
+    return price, delta, gamma, theta, vega, rho
+
+
+def _zero_vol_greeks(context: ChainContext, w: np.ndarray) -> Dict[str, np.ndarray]:
+    """Zero-volatility limit of the Greeks for every strike of a context.
+
+    Args:
+        context: ChainContext for the strikes
+        w: Array of +1.0 for calls and -1.0 for puts
+
+    Returns:
+        Dictionary of arrays: price, delta, gamma, theta, vega, rho
+    """
+    # d1 and d2 tend to +/-inf with the sign of log(S/K) + rT
+    r = context.risk_free_rate
+    t = context.time_to_expiry
+    moneyness = w * (context.log_sk + r * t)
+    cdf = np.where(moneyness == 0, 0.5, moneyness > 0).astype(context.dtype)
+    w_k_cdf = w * context.strikes * context.disc * cdf
+    zeros = np.zeros_like(cdf)
+
+    return {
+        "price": w * context.spot * cdf - w_k_cdf,
+        "delta": w * cdf,
+        "gamma": zeros,
+        "theta": -r * w_k_cdf / 365,
+        "vega": zeros,
+        "rho": t * w_k_cdf / 100,
+    }
+
 
 @dataclass
 class GreeksResult:
@@ -51,17 +190,23 @@ class GreeksCalculator:
         if time_to_expiry <= 0:
             raise ValueError("Time to expiry must be positive")
 
+        vol_sqrt_t = volatility * math.sqrt(time_to_expiry)
         d1 = (
-            np.log(spot / strike)
+            math.log(spot / strike)
             + (self.risk_free_rate + 0.5 * volatility**2) * time_to_expiry
-        ) / (volatility * np.sqrt(time_to_expiry))
+        ) / vol_sqrt_t
 
-        d2 = d1 - volatility * np.sqrt(time_to_expiry)
+        d2 = d1 - vol_sqrt_t
 
         return d1, d2
 
     def call_price(
-        self, spot: float, strike: float, time_to_expiry: float, volatility: float
+        self,
+        spot: float,
+        strike: float,
+        time_to_expiry: float,
+        volatility: float,
+        disc: Optional[float] = None,
     ) -> float:
         """Calculate Black-Scholes call option price.
 
@@ -70,20 +215,26 @@ class GreeksCalculator:
             strike: Strike price
             time_to_expiry: Time to expiry in years
             volatility: Implied volatility
+            disc: Precomputed discount factor exp(-rT), if already known
 
         Returns:
             Call option price
         """
         d1, d2 = self.calculate_d1_d2(spot, strike, time_to_expiry, volatility)
+        if disc is None:
+            disc = math.exp(-self.risk_free_rate * time_to_expiry)
 
-        call = spot * norm.cdf(d1) - strike * np.exp(
-            -self.risk_free_rate * time_to_expiry
-        ) * norm.cdf(d2)
+        call = spot * _norm_cdf(d1) - strike * disc * _norm_cdf(d2)
 
         return call
 
     def put_price(
-        self, spot: float, strike: float, time_to_expiry: float, volatility: float
+        self,
+        spot: float,
+        strike: float,
+        time_to_expiry: float,
+        volatility: float,
+        disc: Optional[float] = None,
     ) -> float:
         """Calculate Black-Scholes put option price.
 
@@ -92,15 +243,16 @@ class GreeksCalculator:
             strike: Strike price
             time_to_expiry: Time to expiry in years
             volatility: Implied volatility
+            disc: Precomputed discount factor exp(-rT), if already known
 
         Returns:
             Put option price
         """
         d1, d2 = self.calculate_d1_d2(spot, strike, time_to_expiry, volatility)
+        if disc is None:
+            disc = math.exp(-self.risk_free_rate * time_to_expiry)
 
-        put = strike * np.exp(-self.risk_free_rate * time_to_expiry) * norm.cdf(
-            -d2
-        ) - spot * norm.cdf(-d1)
+        put = strike * disc * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
 
         return put
 
@@ -127,65 +279,261 @@ class GreeksCalculator:
         if option_type not in ["call", "put"]:
             raise ValueError("option_type must be 'call' or 'put'")
 
-        d1, d2 = self.calculate_d1_d2(spot, strike, time_to_expiry, volatility)
+        if time_to_expiry <= 0:
+            raise ValueError("Time to expiry must be positive")
 
-        # Calculate price
-        if option_type == "call":
-            price = self.call_price(spot, strike, time_to_expiry, volatility)
-        else:
-            price = self.put_price(spot, strike, time_to_expiry, volatility)
+        price, delta, gamma, theta, vega, rho = _greeks_core(
+            float(spot),
+            float(strike),
+            float(time_to_expiry),
+            float(volatility),
+            float(self.risk_free_rate),
+            option_type == "call",
+        )
+        return GreeksResult(
+            price=price, delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho
+        )
 
-        # Delta
-        if option_type == "call":
-            delta = norm.cdf(d1)
-        else:
-            delta = norm.cdf(d1) - 1
-
-        # Gamma (same for call and put)
-        gamma = norm.pdf(d1) / (spot * volatility * np.sqrt(time_to_expiry))
-
-        # Theta (daily)
-        if option_type == "call":
-            theta = (
-                -spot * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry))
-                - self.risk_free_rate
-                * strike
-                * np.exp(-self.risk_free_rate * time_to_expiry)
-                * norm.cdf(d2)
-            ) / 365
-        else:
-            theta = (
-                -spot * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry))
-                + self.risk_free_rate
-                * strike
-                * np.exp(-self.risk_free_rate * time_to_expiry)
-                * norm.cdf(-d2)
-            ) / 365
-
-        # Vega (for 1% change in volatility)
-        vega = spot * norm.pdf(d1) * np.sqrt(time_to_expiry) / 100
-
-        # Rho (for 1% change in interest rate)
-        if option_type == "call":
-            rho = (
-                strike
-                * time_to_expiry
-                * np.exp(-self.risk_free_rate * time_to_expiry)
-                * norm.cdf(d2)
-                / 100
-            )
-        else:
-            rho = (
-                -strike
-                * time_to_expiry
-                * np.exp(-self.risk_free_rate * time_to_expiry)
-                * norm.cdf(-d2)
-                / 100
+    def calculate_greeks_vec(
+        self,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        volatility: Union[float, np.ndarray],
+        option_type: str = "call",
+        dtype: np.dtype = np.float64,
+    ) -> Dict[str, np.ndarray]:
+        """Calculate all Greeks for an array of strikes in one pass.
+
+        d1, d2, the normal CDF/PDF terms and the discount factor are computed
+        once and shared by every Greek. Pass dtype=np.float32 for screening
+        and aggregation (GEX, rankings); keep float64 for risk numbers.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            volatility: Implied volatility (scalar or array matching strikes)
+            option_type: 'call' or 'put'
+            dtype: Floating point dtype used for the whole calculation
+
+        Returns:
+            Dictionary of arrays: price, delta, gamma, theta, vega, rho
+        """
+        if option_type not in ["call", "put"]:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        context = self.chain_context(spot, strikes, time_to_expiry, dtype=dtype)
+        return self.greeks_from_context(
+            context, volatility, is_call=option_type == "call"
+        )
+
+    def chain_context(
+        self,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        dtype: np.dtype = np.float64,
+    ) -> ChainContext:
+        """Build a ChainContext at this calculator's risk-free rate.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            dtype: Floating point dtype of the context
+
+        Returns:
+            ChainContext shared by the *_from_context methods
+        """
+        return ChainContext.build(
+            spot, strikes, time_to_expiry, self.risk_free_rate, dtype=dtype
+        )
+
+    def greeks_from_context(
+        self,
+        context: ChainContext,
+        volatility: Union[float, np.ndarray],
+        is_call: Union[bool, np.ndarray] = True,
+    ) -> Dict[str, np.ndarray]:
+        """Calculate all Greeks for a chain from its precomputed context.
+
+        Calls and puts share one branchless formula: with w = +1 for calls
+        and -1 for puts, each put Greek is the call expression evaluated at
+        -d1/-d2 and scaled by w. Mixed chains need no per-row branching, and
+        the strikes are evaluated in parallel by the greeks_batch kernel.
+
+        Rows with a non-positive or missing volatility get the
+        zero-volatility limit, as in calculate_greeks.
+
+        Args:
+            context: ChainContext for the strikes
+            volatility: Implied volatility (scalar or array matching strikes)
+            is_call: True for calls, False for puts (scalar or boolean array)
+
+        Returns:
+            Dictionary of arrays: price, delta, gamma, theta, vega, rho
+        """
+        dtype = context.dtype
+        shape = context.strikes.shape
+        volatilities = np.broadcast_to(np.asarray(volatility, dtype=dtype), shape)
+        w = np.ascontiguousarray(
+            np.broadcast_to(np.where(is_call, 1.0, -1.0), shape), dtype=dtype
+        )
+
+        # The fastmath kernel assumes finite inputs, so it runs on sanitized
+        # vols and the invalid rows are overwritten afterwards
+        valid = np.isfinite(volatilities) & (volatilities > 0)
+        vols = np.where(valid, volatilities, 1.0).astype(dtype, copy=False)
+
+        # Scalars in the context dtype, so the kernel specializes on it
+        scalar = dtype.type
+        greeks = {name: np.empty(shape, dtype=dtype) for name in GREEK_NAMES}
+        greeks_batch(
+            scalar(context.spot),
+            context.strikes,
+            context.log_sk,
+            scalar(context.time_to_expiry),
+            scalar(context.sqrt_t),
+            scalar(context.risk_free_rate),
+            scalar(context.disc),
+            vols,
+            w,
+            *greeks.values(),
+        )
+
+        invalid = ~valid
+        if invalid.any():
+            limit = _zero_vol_greeks(context, w)
+            for name in GREEK_NAMES:
+                np.copyto(greeks[name], limit[name], where=invalid)
+        return greeks
+
+    def calculate_gamma_vec(
+        self,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        volatilities: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        """Calculate Black-Scholes gamma for an array of strikes.
+
+        Rows with a non-positive or missing volatility get a gamma of 0.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            volatilities: Array of implied volatilities (same shape as strikes)
+            out: Optional preallocated array (of dtype) for the result
+            dtype: Floating point dtype of the inputs and result
+
+        Returns:
+            Array of gammas (same for calls and puts)
+        """
+        if time_to_expiry <= 0:
+            raise ValueError("Time to expiry must be positive")
+
+        context = self.chain_context(spot, strikes, time_to_expiry, dtype=dtype)
+        return self.gamma_from_context(context, volatilities, out=out)
+
+    def gamma_from_context(
+        self,
+        context: ChainContext,
+        volatilities: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Calculate Black-Scholes gamma for a chain from its context.
+
+        Rows with a non-positive or missing volatility get a gamma of 0.
+
+        Args:
+            context: ChainContext for the strikes
+            volatilities: Array of implied volatilities (same shape as strikes)
+            out: Optional preallocated array (of the context dtype) for the result
+
+        Returns:
+            Array of gammas (same for calls and puts)
+
+        Raises:
+            ValueError: If volatilities or out do not match the context's strikes
+        """
+        dtype = context.dtype
+        volatilities = np.ascontiguousarray(volatilities, dtype=dtype)
+        if out is None:
+            out = np.empty_like(context.strikes)
+
+        # The kernel indexes without bounds checks
+        shape = context.log_sk.shape
+        if volatilities.shape != shape or out.shape != shape:
+            raise ValueError(
+                f"volatilities {volatilities.shape} and out {out.shape} "
+                f"must match strikes {shape}"
             )
 
-        return GreeksResult(
-            price=price, delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho
+        # Run the kernel straight through on sanitized vols, then blend the
+        # invalid rows to zero in one masked pass
+        valid = np.isfinite(volatilities) & (volatilities > 0)
+        vols = np.where(valid, volatilities, 1.0).astype(dtype, copy=False)
+
+        scalar = dtype.type
+        bs_gamma_batch(
+            scalar(context.spot),
+            context.log_sk,
+            scalar(context.time_to_expiry),
+            scalar(context.sqrt_t),
+            scalar(context.risk_free_rate),
+            vols,
+            out,
         )
+        np.copyto(out, 0.0, where=~valid)
+        return out
+
+    def _price_and_vega(
+        self,
+        spot: float,
+        volatility: float,
+        time_to_expiry: float,
+        sqrt_t: float,
+        log_sk: float,
+        k_disc: float,
+        is_call: bool,
+    ) -> tuple[float, float, float]:
+        """Price an option together with its vega and vomma.
+
+        The volatility-independent terms are passed in so solvers can
+        compute them once per option rather than once per iteration.
+
+        Args:
+            spot: Current spot price
+            volatility: Implied volatility
+            time_to_expiry: Time to expiry in years
+            sqrt_t: sqrt(time_to_expiry)
+            log_sk: log(spot / strike)
+            k_disc: Discounted strike, strike * exp(-rT)
+            is_call: True for a call, False for a put
+
+        Returns:
+            Tuple of (price, vega, vomma), with vega and vomma per unit of
+            volatility
+        """
+        vol_sqrt_t = volatility * sqrt_t
+        d1 = (
+            log_sk + (self.risk_free_rate + 0.5 * volatility**2) * time_to_expiry
+        ) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+
+        if is_call:
+            price = spot * _norm_cdf(d1) - k_disc * _norm_cdf(d2)
+        else:
+            price = k_disc * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
+
+        vega = spot * _norm_pdf(d1) * sqrt_t
+        vomma = vega * d1 * d2 / volatility
+
+        return price, vega, vomma
 
     def implied_volatility(
         self,
@@ -197,7 +545,12 @@ class GreeksCalculator:
         max_iterations: int = 100,
         tolerance: float = 1e-5,
     ) -> Optional[float]:
-        """Calculate implied volatility using Newton-Raphson method.
+        """Calculate implied volatility using a safeguarded Halley method.
+
+        Each iteration takes a Halley step from price, vega and vomma. The
+        root is kept inside a bracket that shrinks with the sign of the
+        pricing error, and a bisection step is used whenever the Halley
+        step would leave it.
 
         Args:
             market_price: Observed market price of the option
@@ -211,42 +564,180 @@ class GreeksCalculator:
         Returns:
             Implied volatility or None if not converged
         """
+        if time_to_expiry <= 0:
+            raise ValueError("Time to expiry must be positive")
+
+        is_call = option_type == "call"
+        lower, upper = IV_LOWER_BOUND, IV_UPPER_BOUND
+
+        # Terms that do not depend on volatility
+        sqrt_t = math.sqrt(time_to_expiry)
+        log_sk = math.log(spot / strike)
+        k_disc = strike * math.exp(-self.risk_free_rate * time_to_expiry)
+
         # Initial guess for volatility
         volatility = 0.20
 
         for i in range(max_iterations):
-            # Calculate theoretical price
-            if option_type == "call":
-                theoretical_price = self.call_price(
-                    spot, strike, time_to_expiry, volatility
-                )
-            else:
-                theoretical_price = self.put_price(
-                    spot, strike, time_to_expiry, volatility
-                )
-
-            # Calculate vega
-            d1, _ = self.calculate_d1_d2(spot, strike, time_to_expiry, volatility)
-            vega = spot * norm.pdf(d1) * np.sqrt(time_to_expiry)
+            price, vega, vomma = self._price_and_vega(
+                spot, volatility, time_to_expiry, sqrt_t, log_sk, k_disc, is_call
+            )
 
             # Price difference
-            diff = theoretical_price - market_price
+            diff = price - market_price
 
             # Check convergence
             if abs(diff) < tolerance:
                 return volatility
 
-            # Newton-Raphson update
-            if vega > 0:
-                volatility = volatility - diff / vega
+            # Price increases with volatility, so the root lies below an
+            # overpriced guess and above an underpriced one
+            if diff > 0:
+                upper = volatility
             else:
-                return None
+                lower = volatility
 
-            # Ensure volatility stays positive
-            if volatility <= 0:
-                volatility = 0.01
+            if upper - lower < IV_BRACKET_TOLERANCE:
+                break
+
+            # Halley update, falling back to Newton if the correction
+            # term would flip the step
+            if vega > 0:
+                newton_step = diff / vega
+                denominator = 1 - 0.5 * newton_step * vomma / vega
+                step = newton_step / denominator if denominator > 0 else newton_step
+                volatility -= step
+
+            # Bisect whenever the step leaves the bracket (or vega vanished)
+            if not lower < volatility < upper:
+                volatility = 0.5 * (lower + upper)
 
         logger.warning(
-            f"Implied volatility did not converge after {max_iterations} iterations"
+            "Implied volatility did not converge after %d iterations", max_iterations
         )
         return None
+
+    def _price_and_vega_vec(
+        self,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        volatilities: np.ndarray,
+        is_call: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized price and vega for a mix of calls and puts.
+
+        Args:
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            volatilities: Array of implied volatilities
+            is_call: Boolean array, True for calls
+
+        Returns:
+            Tuple of (price, vega) arrays, vega per unit of volatility
+        """
+        sqrt_t = math.sqrt(time_to_expiry)
+        vol_sqrt_t = volatilities * sqrt_t
+        d1 = (
+            np.log(spot / strikes)
+            + (self.risk_free_rate + 0.5 * volatilities**2) * time_to_expiry
+        ) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        k_disc = strikes * math.exp(-self.risk_free_rate * time_to_expiry)
+
+        # Puts from put-call parity
+        call = spot * ndtr(d1) - k_disc * ndtr(d2)
+        price = np.where(is_call, call, call - spot + k_disc)
+        vega = spot * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sqrt_t
+
+        return price, vega
+
+    def implied_volatility_vec(
+        self,
+        market_prices: np.ndarray,
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        is_call: Union[bool, np.ndarray] = True,
+        max_iterations: int = 100,
+        tolerance: float = 1e-5,
+    ) -> np.ndarray:
+        """Calculate implied volatilities for a whole chain at once.
+
+        All options take vectorized Newton steps together. Any that have not
+        converged afterwards are solved one at a time with Brent's method.
+
+        Args:
+            market_prices: Observed option prices
+            spot: Current spot price
+            strikes: Array of strike prices
+            time_to_expiry: Time to expiry in years
+            is_call: True for calls (scalar or boolean array)
+            max_iterations: Maximum number of Newton iterations
+            tolerance: Convergence tolerance
+
+        Returns:
+            Array of implied volatilities (NaN where the price violates the
+            no-arbitrage bounds or no solution exists)
+        """
+        if time_to_expiry <= 0:
+            raise ValueError("Time to expiry must be positive")
+
+        market_prices = np.asarray(market_prices, dtype=np.float64)
+        strikes = np.asarray(strikes, dtype=np.float64)
+        is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+
+        # No-arbitrage bounds: intrinsic value <= price < spot (calls) / PV(K) (puts)
+        k_disc = strikes * math.exp(-self.risk_free_rate * time_to_expiry)
+        intrinsic = np.where(is_call, np.maximum(spot - k_disc, 0), np.maximum(k_disc - spot, 0))
+        upper = np.where(is_call, spot, k_disc)
+        valid = np.isfinite(market_prices) & (market_prices >= intrinsic) & (market_prices < upper)
+
+        volatility = np.full(strikes.shape, 0.20)
+        converged = np.zeros(strikes.shape, dtype=bool)
+        active = valid.copy()
+
+        for i in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+
+            price, vega = self._price_and_vega_vec(
+                spot, strikes[idx], time_to_expiry, volatility[idx], is_call[idx]
+            )
+            diff = price - market_prices[idx]
+
+            done = np.abs(diff) < tolerance
+            stalled = ~done & (vega < 1e-12)
+            converged[idx[done]] = True
+            active[idx[done | stalled]] = False
+
+            # Newton update for the rest
+            step = ~(done | stalled)
+            volatility[idx[step]] = np.clip(
+                volatility[idx[step]] - diff[step] / vega[step],
+                IV_LOWER_BOUND,
+                IV_UPPER_BOUND,
+            )
+
+        # Brent fallback for anything Newton could not settle
+        sqrt_t = math.sqrt(time_to_expiry)
+        disc = math.exp(-self.risk_free_rate * time_to_expiry)
+        for i in np.flatnonzero(valid & ~converged):
+            log_sk = math.log(spot / strikes[i])
+            k_disc = strikes[i] * disc
+
+            def pricing_error(vol: float) -> float:
+                price, _, _ = self._price_and_vega(
+                    spot, vol, time_to_expiry, sqrt_t, log_sk, k_disc, is_call[i]
+                )
+                return price - market_prices[i]
+
+            if pricing_error(IV_LOWER_BOUND) * pricing_error(IV_UPPER_BOUND) < 0:
+                volatility[i] = brentq(pricing_error, IV_LOWER_BOUND, IV_UPPER_BOUND)
+            else:
+                valid[i] = False
+
+        volatility[~valid] = np.nan
+        return volatility
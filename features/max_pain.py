@@ -2,9 +2,16 @@
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Union
 
 from config.logging_config import get_logger
+from features._max_pain_kernels import pain_curve
+from features.chain_arrays import (
+    ChainArrays,
+    as_chain_arrays,
+    chain_column,
+    top_k_indices,
+)
 
 logger = get_logger(__name__)
 
@@ -17,89 +24,67 @@ class MaxPainCalculator:
         pass
 
     def calculate_max_pain(
-        self, option_chain: pd.DataFrame, lot_size: int = 50
+        self, option_chain: Union[pd.DataFrame, ChainArrays], lot_size: int = 50
     ) -> Tuple[float, pd.DataFrame]:
         """Calculate Max Pain strike (minimum loss to option writers).
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi
+                (or a ChainArrays snapshot)
             lot_size: Contract lot size (default 50 for NIFTY)
 
         Returns:
             Tuple of (max_pain_strike, pain_curve_df)
         """
-        strikes = option_chain["strike"].values
-        call_oi = option_chain["call_oi"].fillna(0).values
-        put_oi = option_chain["put_oi"].fillna(0).values
-
-        pain_data = []
-
-        # For each possible settlement price (at each strike)
-        for settlement in strikes:
-            # Calculate total loss for call writers (ITM calls)
-            # Loss occurs when settlement > strike
-            call_loss = sum(
-                (settlement - strike) * call_oi[i] * lot_size
-                for i, strike in enumerate(strikes)
-                if settlement > strike
-            )
-
-            # Calculate total loss for put writers (ITM puts)
-            # Loss occurs when settlement < strike
-            put_loss = sum(
-                (strike - settlement) * put_oi[i] * lot_size
-                for i, strike in enumerate(strikes)
-                if settlement < strike
-            )
-
-            total_pain = call_loss + put_loss
-
-            pain_data.append(
-                {
-                    "strike": settlement,
-                    "call_loss": call_loss,
-                    "put_loss": put_loss,
-                    "total_pain": total_pain,
-                }
-            )
-
-        pain_df = pd.DataFrame(pain_data)
+        chain = as_chain_arrays(option_chain)
+
+        # Sort once by strike; each strike is a candidate settlement price
+        order = np.argsort(chain.strike, kind="stable")
+        strikes = chain.strike[order]
+        call_oi = chain.call_oi[order]
+        put_oi = chain.put_oi[order]
+
+        call_loss, put_loss = pain_curve(strikes, call_oi, put_oi, float(lot_size))
+        total_pain = call_loss + put_loss
+
+        pain_df = pd.DataFrame(
+            {
+                "strike": strikes,
+                "call_loss": call_loss,
+                "put_loss": put_loss,
+                "total_pain": total_pain,
+            }
+        )
 
         # Max Pain is the strike with minimum total pain
-        max_pain_idx = pain_df["total_pain"].idxmin()
-        max_pain_strike = pain_df.loc[max_pain_idx, "strike"]
+        max_pain_strike = strikes[np.argmin(total_pain)]
 
-        logger.info(f"Max Pain calculated at strike: {max_pain_strike}")
+        logger.info("Max Pain calculated at strike: %s", max_pain_strike)
 
         return max_pain_strike, pain_df
 
     def find_support_resistance(
-        self, option_chain: pd.DataFrame, num_levels: int = 3
+        self, option_chain: Union[pd.DataFrame, ChainArrays], num_levels: int = 3
     ) -> Dict[str, list]:
         """Find support and resistance levels based on OI walls.
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi
+                (or a ChainArrays snapshot)
             num_levels: Number of support/resistance levels to identify
 
         Returns:
             Dictionary with support and resistance levels
         """
+        strikes = chain_column(option_chain, "strike")
+
         # Resistance: High call OI (sellers defending these levels)
-        call_oi_sorted = (
-            option_chain[["strike", "call_oi"]]
-            .sort_values("call_oi", ascending=False)
-            .head(num_levels)
-        )
-        resistance_levels = call_oi_sorted["strike"].tolist()
+        call_idx = top_k_indices(chain_column(option_chain, "call_oi"), num_levels)
+        resistance_levels = strikes[call_idx].tolist()
 
         # Support: High put OI (buyers supporting these levels)
-        put_oi_sorted = (
-            option_chain[["strike", "put_oi"]]
-            .sort_values("put_oi", ascending=False)
-            .head(num_levels)
-        )
-        support_levels = put_oi_sorted["strike"].tolist()
+        put_idx = top_k_indices(chain_column(option_chain, "put_oi"), num_levels)
+        support_levels = strikes[put_idx].tolist()
 
         return {
             "resistance": sorted(resistance_levels, reverse=True),
@@ -121,8 +106,7 @@ class MaxPainCalculator:
         """
         # Filter strikes near spot
         near_spot = option_chain[
-            (option_chain["strike"] >= spot - range_points)
-            & (option_chain["strike"] <= spot + range_points)
+            option_chain["strike"].between(spot - range_points, spot + range_points)
         ]
 
         total_call_oi = near_spot["call_oi"].sum()
@@ -148,7 +132,7 @@ class MaxPainCalculator:
         Args:
             current_price: Current spot price
             max_pain: Max Pain strike
-            pain_df: Pain curve DataFrame from calculate_max_pain
+            pain_df: Pain curve DataFrame from calculate_max_pain (sorted by strike)
 
         Returns:
             Dictionary with pain score metrics
@@ -156,12 +140,20 @@ class MaxPainCalculator:
         distance_from_max_pain = current_price - max_pain
         distance_percentage = (distance_from_max_pain / max_pain) * 100
 
-        # Get current pain level
-        closest_strike_idx = (pain_df["strike"] - current_price).abs().idxmin()
-        current_pain = pain_df.loc[closest_strike_idx, "total_pain"]
+        strikes = pain_df["strike"].to_numpy()
+        pains = pain_df["total_pain"].to_numpy()
+
+        # Get current pain level at the closest strike: binary search the
+        # sorted strikes, then pick the nearer neighbour (lower one on ties)
+        idx = int(np.searchsorted(strikes, current_price))
+        if idx == len(strikes) or (
+            idx > 0 and current_price - strikes[idx - 1] <= strikes[idx] - current_price
+        ):
+            idx -= 1
+        current_pain = pains[idx]
 
         # Get minimum pain (at max pain strike)
-        min_pain = pain_df["total_pain"].min()
+        min_pain = pains.min()
 
         # Pain score: how much more pain than minimum
         pain_score = (current_pain - min_pain) / min_pain if min_pain > 0 else 0
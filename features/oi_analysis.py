@@ -2,14 +2,29 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 
 from config.constants import PCR_BULLISH_THRESHOLD, PCR_BEARISH_THRESHOLD
 from config.logging_config import get_logger
+from features.chain_arrays import ChainArrays, chain_column, top_k_indices
 
 logger = get_logger(__name__)
 
 
+def _oi_values(values: pd.Series) -> np.ndarray:
+    """OI column as a NumPy array, keeping NaN where OI is missing."""
+    if values.dtype.kind in "iuf":
+        return values.to_numpy()
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _zero_missing(values: np.ndarray) -> np.ndarray:
+    """Replace NaN and inf with 0."""
+    if values.dtype.kind != "f":
+        return values
+    return np.where(np.isfinite(values), values, 0.0)
+
+
 class OIAnalyzer:
     """Analyze Open Interest patterns."""
 
@@ -18,29 +33,30 @@ class OIAnalyzer:
         pass
 
     def calculate_pcr(
-        self, option_chain: pd.DataFrame, method: str = "oi"
+        self, option_chain: Union[pd.DataFrame, ChainArrays], method: str = "oi"
     ) -> float:
         """Calculate Put-Call Ratio.
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi, call_volume, put_volume
+                (or a ChainArrays snapshot)
             method: 'oi' for OI-based PCR, 'volume' for volume-based PCR
 
         Returns:
             Put-Call Ratio
         """
         if method == "oi":
-            total_put_oi = option_chain["put_oi"].fillna(0).sum()
-            total_call_oi = option_chain["call_oi"].fillna(0).sum()
-            pcr = total_put_oi / total_call_oi if total_call_oi > 0 else 0
+            put_col, call_col = "put_oi", "call_oi"
         elif method == "volume":
-            total_put_volume = option_chain.get("put_volume", pd.Series([0])).fillna(0).sum()
-            total_call_volume = option_chain.get("call_volume", pd.Series([0])).fillna(0).sum()
-            pcr = total_put_volume / total_call_volume if total_call_volume > 0 else 0
+            put_col, call_col = "put_volume", "call_volume"
         else:
             raise ValueError("method must be 'oi' or 'volume'")
 
-        return pcr
+        # Missing columns and NaNs count as zero
+        total_put = chain_column(option_chain, put_col).sum()
+        total_call = chain_column(option_chain, call_col).sum()
+
+        return float(total_put / total_call) if total_call > 0 else 0.0
 
     def interpret_pcr(self, pcr: float) -> str:
         """Interpret Put-Call Ratio signal.
@@ -72,33 +88,54 @@ class OIAnalyzer:
         Returns:
             DataFrame with OI change analysis
         """
-        # Merge on strike
-        merged = current_chain.merge(
-            previous_chain,
-            on="strike",
-            suffixes=("_current", "_previous"),
-        )
-
-        # Calculate OI changes
-        merged["call_oi_change"] = (
-            merged["call_oi_current"] - merged["call_oi_previous"]
-        )
-        merged["put_oi_change"] = merged["put_oi_current"] - merged["put_oi_previous"]
-
-        # Calculate percentage changes
-        merged["call_oi_change_pct"] = (
-            merged["call_oi_change"] / merged["call_oi_previous"] * 100
-        )
-        merged["put_oi_change_pct"] = (
-            merged["put_oi_change"] / merged["put_oi_previous"] * 100
-        )
-
-        # Replace inf values with 0
-        merged.replace([np.inf, -np.inf], 0, inplace=True)
-        merged.fillna(0, inplace=True)
-
-        return merged[
-            [
+        columns = ["strike", "call_oi", "put_oi"]
+        previous_strikes = pd.Index(previous_chain["strike"])
+
+        if previous_strikes.is_unique:
+            # Align on the previous chain's strike index (inner join, in
+            # current chain order) without building a merged frame
+            positions = previous_strikes.get_indexer(current_chain["strike"])
+            matched = positions >= 0
+            positions = positions[matched]
+            current = {"strike": current_chain["strike"].to_numpy()[matched]}
+            previous = {}
+            for col in columns[1:]:
+                current[col] = _oi_values(current_chain[col])[matched]
+                previous[col] = _oi_values(previous_chain[col])[positions]
+        else:
+            # Duplicate strikes need the merge's many-to-many pairing
+            merged = current_chain[columns].merge(
+                previous_chain[columns],
+                on="strike",
+                suffixes=("_current", "_previous"),
+            )
+            current = {"strike": merged["strike"].to_numpy()}
+            previous = {}
+            for col in columns[1:]:
+                current[col] = _oi_values(merged[f"{col}_current"])
+                previous[col] = _oi_values(merged[f"{col}_previous"])
+
+        result = {
+            "strike": current["strike"],
+            "call_oi_current": _zero_missing(current["call_oi"]),
+            "put_oi_current": _zero_missing(current["put_oi"]),
+        }
+        for side in ("call", "put"):
+            col = f"{side}_oi"
+
+            # Changes involving missing OI stay NaN until the end, so they
+            # report 0 rather than a change from (or to) zero
+            change = np.subtract(current[col], previous[col])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct = np.true_divide(change, previous[col]) * 100
+
+            # 0 where OI is missing or there was no previous OI
+            result[f"{side}_oi_change"] = _zero_missing(change)
+            result[f"{side}_oi_change_pct"] = _zero_missing(pct)
+
+        return pd.DataFrame(
+            result,
+            columns=[
                 "strike",
                 "call_oi_current",
                 "put_oi_current",
@@ -106,65 +143,72 @@ class OIAnalyzer:
                 "put_oi_change",
                 "call_oi_change_pct",
                 "put_oi_change_pct",
-            ]
-        ]
+            ],
+        )
 
     def find_call_put_walls(
-        self, option_chain: pd.DataFrame, num_walls: int = 5
+        self, option_chain: Union[pd.DataFrame, ChainArrays], num_walls: int = 5
     ) -> Dict[str, list]:
         """Identify major call and put walls (max OI strikes).
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi
+                (or a ChainArrays snapshot)
             num_walls: Number of walls to identify
 
         Returns:
             Dictionary with call and put walls
         """
+        strikes = chain_column(option_chain, "strike")
+        call_oi = chain_column(option_chain, "call_oi")
+        put_oi = chain_column(option_chain, "put_oi")
+
         # Call walls - highest call OI
-        call_walls = (
-            option_chain[["strike", "call_oi"]]
-            .sort_values("call_oi", ascending=False)
-            .head(num_walls)
-        )
+        call_idx = top_k_indices(call_oi, num_walls)
 
         # Put walls - highest put OI
-        put_walls = (
-            option_chain[["strike", "put_oi"]]
-            .sort_values("put_oi", ascending=False)
-            .head(num_walls)
-        )
+        put_idx = top_k_indices(put_oi, num_walls)
 
         return {
-            "call_walls": call_walls[["strike", "call_oi"]].to_dict("records"),
-            "put_walls": put_walls[["strike", "put_oi"]].to_dict("records"),
+            "call_walls": [
+                {"strike": strike, "call_oi": oi}
+                for strike, oi in zip(
+                    strikes[call_idx].tolist(), call_oi[call_idx].tolist()
+                )
+            ],
+            "put_walls": [
+                {"strike": strike, "put_oi": oi}
+                for strike, oi in zip(
+                    strikes[put_idx].tolist(), put_oi[put_idx].tolist()
+                )
+            ],
         }
 
     def calculate_oi_distribution(
-        self, option_chain: pd.DataFrame, spot: float
+        self, option_chain: Union[pd.DataFrame, ChainArrays], spot: float
     ) -> Dict[str, any]:
         """Calculate OI distribution around spot.
 
         Args:
             option_chain: DataFrame with columns: strike, call_oi, put_oi
+                (or a ChainArrays snapshot)
             spot: Current spot price
 
         Returns:
             Dictionary with OI distribution metrics
         """
-        # ITM/OTM classification
-        option_chain = option_chain.copy()
-        option_chain["itm_call"] = option_chain["strike"] < spot
-        option_chain["itm_put"] = option_chain["strike"] > spot
+        strikes = chain_column(option_chain, "strike")
+        call_oi = chain_column(option_chain, "call_oi")
+        put_oi = chain_column(option_chain, "put_oi")
 
-        # Calculate OI for ITM/OTM options
-        itm_call_oi = option_chain[option_chain["itm_call"]]["call_oi"].sum()
-        otm_call_oi = option_chain[~option_chain["itm_call"]]["call_oi"].sum()
-        itm_put_oi = option_chain[option_chain["itm_put"]]["put_oi"].sum()
-        otm_put_oi = option_chain[~option_chain["itm_put"]]["put_oi"].sum()
+        total_call_oi = call_oi.sum()
+        total_put_oi = put_oi.sum()
 
-        total_call_oi = itm_call_oi + otm_call_oi
-        total_put_oi = itm_put_oi + otm_put_oi
+        # ITM calls are below spot, ITM puts above; OTM is the remainder
+        itm_call_oi = call_oi[strikes < spot].sum()
+        otm_call_oi = total_call_oi - itm_call_oi
+        itm_put_oi = put_oi[strikes > spot].sum()
+        otm_put_oi = total_put_oi - itm_put_oi
 
         return {
             "itm_call_oi": itm_call_oi,
@@ -199,20 +243,21 @@ class OIAnalyzer:
         Returns:
             Dictionary with buildup interpretation
         """
-        # Classify by strike relative to spot
-        oi_change_df = oi_change_df.copy()
-        oi_change_df["relative_to_spot"] = oi_change_df["strike"].apply(
-            lambda x: "above" if x > spot else "below"
-        )
+        # Classify by strike relative to spot (strikes at spot count as below)
+        above = oi_change_df["strike"].to_numpy() > spot
+        call_change = oi_change_df["call_oi_change"].to_numpy()
+        put_change = oi_change_df["put_oi_change"].to_numpy()
 
         # Aggregate changes
-        above_spot = oi_change_df[oi_change_df["relative_to_spot"] == "above"]
-        below_spot = oi_change_df[oi_change_df["relative_to_spot"] == "below"]
+        call_above_change = call_change[above].sum()
+        call_below_change = call_change[~above].sum()
+        put_above_change = put_change[above].sum()
+        put_below_change = put_change[~above].sum()
 
-        call_above_increase = above_spot["call_oi_change"].sum() > 0
-        call_below_increase = below_spot["call_oi_change"].sum() > 0
-        put_above_increase = above_spot["put_oi_change"].sum() > 0
-        put_below_increase = below_spot["put_oi_change"].sum() > 0
+        call_above_increase = call_above_change > 0
+        call_below_increase = call_below_change > 0
+        put_above_increase = put_above_change > 0
+        put_below_increase = put_below_change > 0
 
         # Interpret patterns
         signals = []
@@ -228,8 +273,8 @@ class OIAnalyzer:
 
         return {
             "signals": signals,
-            "call_above_change": above_spot["call_oi_change"].sum(),
-            "call_below_change": below_spot["call_oi_change"].sum(),
-            "put_above_change": above_spot["put_oi_change"].sum(),
-            "put_below_change": below_spot["put_oi_change"].sum(),
+            "call_above_change": call_above_change,
+            "call_below_change": call_below_change,
+            "put_above_change": put_above_change,
+            "put_below_change": put_below_change,
         }
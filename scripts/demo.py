@@ -4,10 +4,12 @@ import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from features.chain_arrays import to_chain_arrays
 from features.greeks_calculator import GreeksCalculator
 from features.gex_calculator import GammaExposureCalculator
 from features.max_pain import MaxPainCalculator
@@ -17,45 +19,48 @@ from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-def create_sample_option_chain(spot: float = 19500) -> pd.DataFrame:
+def create_sample_option_chain(
+    spot: float = 19500, rng: Optional[np.random.Generator] = None
+) -> pd.DataFrame:
     """Create a sample option chain for demonstration.
     
     Args:
         spot: Current spot price
+        rng: Random generator to draw from (a fresh one if omitted)
         
     Returns:
         Sample option chain DataFrame
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Generate strikes around spot
     strikes = np.arange(spot - 500, spot + 500, 100)
-    
-    data = []
-    for strike in strikes:
-        # Simulate realistic OI distribution
-        distance_from_spot = abs(strike - spot)
-        base_oi = 5000 - (distance_from_spot * 5)  # Higher OI near spot
-        
-        # Add some randomness
-        call_oi = max(100, base_oi + np.random.randint(-1000, 1000))
-        put_oi = max(100, base_oi + np.random.randint(-1000, 1000))
-        
-        # Simulate IV smile
-        iv_base = 0.18 + (distance_from_spot / 10000)  # Higher IV further from spot
-        
-        data.append({
-            "strike": strike,
-            "expiry_date": "2025-01-02",
-            "call_oi": call_oi,
-            "call_volume": int(call_oi * 0.1),
-            "call_ltp": max(10, (spot - strike) * 0.5) if strike < spot else 50,
-            "call_iv": iv_base + np.random.uniform(-0.02, 0.02),
-            "put_oi": put_oi,
-            "put_volume": int(put_oi * 0.1),
-            "put_ltp": max(10, (strike - spot) * 0.5) if strike > spot else 50,
-            "put_iv": iv_base + np.random.uniform(-0.02, 0.02),
-        })
-    
-    df = pd.DataFrame(data)
+    n = strikes.size
+    
+    # Simulate realistic OI distribution (higher OI near spot)
+    distance_from_spot = np.abs(strikes - spot)
+    base_oi = 5000 - (distance_from_spot * 5)
+    
+    # Add some randomness
+    call_oi = np.maximum(100, base_oi + rng.integers(-1000, 1000, n))
+    put_oi = np.maximum(100, base_oi + rng.integers(-1000, 1000, n))
+    
+    # Simulate IV smile (higher IV further from spot)
+    iv_base = 0.18 + (distance_from_spot / 10000)
+    
+    df = pd.DataFrame({
+        "strike": strikes,
+        "expiry_date": "2025-01-02",
+        "call_oi": call_oi,
+        "call_volume": (call_oi * 0.1).astype(np.int64),
+        "call_ltp": np.where(strikes < spot, np.maximum(10, (spot - strikes) * 0.5), 50),
+        "call_iv": iv_base + rng.uniform(-0.02, 0.02, n),
+        "put_oi": put_oi,
+        "put_volume": (put_oi * 0.1).astype(np.int64),
+        "put_ltp": np.where(strikes > spot, np.maximum(10, (strikes - spot) * 0.5), 50),
+        "put_iv": iv_base + rng.uniform(-0.02, 0.02, n),
+    })
     df.attrs["underlying"] = spot
     df.attrs["timestamp"] = "2025-12-30T15:30:00"
     df.attrs["symbol"] = "NIFTY"
@@ -78,17 +83,25 @@ def main():
     print(f"   Spot Price: ₹{spot:,.2f}")
     print()
     
+    # Clean NaN-free column arrays once, shared by every calculator below
+    chain = to_chain_arrays(option_chain)
+    
     # 1. Greeks Calculation
     print("-" * 80)
     print("1️⃣  GREEKS CALCULATION")
     print("-" * 80)
     calc = GreeksCalculator(risk_free_rate=0.07)
+    days_to_expiry = 3
+    time_to_expiry = days_to_expiry / 365
+    
+    # Shared log(S/K), sqrt(T) and discount terms, reused by Greeks and GEX
+    context = calc.chain_context(spot, chain.strike, time_to_expiry)
     
     # Calculate Greeks for ATM call
     greeks = calc.calculate_greeks(
         spot=spot,
         strike=spot,
-        time_to_expiry=3/365,  # 3 days to expiry
+        time_to_expiry=time_to_expiry,
         volatility=0.20,
         option_type="call"
     )
@@ -99,6 +112,10 @@ def main():
     print(f"  Gamma:  {greeks.gamma:.6f}")
     print(f"  Theta:  {greeks.theta:.4f} (per day)")
     print(f"  Vega:   {greeks.vega:.4f}")
+    
+    # Greeks for every call in the chain from the shared context
+    chain_greeks = calc.greeks_from_context(context, chain.call_iv)
+    print(f"\nChain Call Deltas: {chain_greeks['delta'].min():.4f} to {chain_greeks['delta'].max():.4f}")
     print()
     
     # 2. GEX Analysis
@@ -106,7 +123,9 @@ def main():
     print("2️⃣  GAMMA EXPOSURE (GEX) ANALYSIS")
     print("-" * 80)
     gex_calc = GammaExposureCalculator()
-    gex_df = gex_calc.calculate_chain_gex(option_chain, spot, days_to_expiry=3)
+    gex_df = gex_calc.calculate_chain_gex(
+        chain, spot, days_to_expiry=days_to_expiry, context=context
+    )
     gex_levels = gex_calc.find_gex_levels(gex_df, spot)
     
     print(f"GEX Regime:     {gex_levels['gex_regime'].upper()}")
@@ -130,7 +149,7 @@ def main():
     print("3️⃣  MAX PAIN ANALYSIS")
     print("-" * 80)
     mp_calc = MaxPainCalculator()
-    max_pain, pain_df = mp_calc.calculate_max_pain(option_chain)
+    max_pain, pain_df = mp_calc.calculate_max_pain(chain)
     
     print(f"Max Pain Strike:       ₹{max_pain:.0f}")
     print(f"Current Spot:          ₹{spot:.0f}")
@@ -138,7 +157,7 @@ def main():
     print(f"Distance (% of spot):  {((spot - max_pain) / spot * 100):.2f}%")
     
     # Support and resistance
-    sr_levels = mp_calc.find_support_resistance(option_chain, num_levels=3)
+    sr_levels = mp_calc.find_support_resistance(chain, num_levels=3)
     print(f"\nResistance Levels (High Call OI):")
     for i, level in enumerate(sr_levels['resistance'], 1):
         print(f"  {i}. ₹{level:.0f}")
@@ -155,14 +174,14 @@ def main():
     oi_analyzer = OIAnalyzer()
     
     # PCR
-    pcr = oi_analyzer.calculate_pcr(option_chain, method='oi')
+    pcr = oi_analyzer.calculate_pcr(chain, method='oi')
     sentiment = oi_analyzer.interpret_pcr(pcr)
     
     print(f"Put-Call Ratio (OI):  {pcr:.2f}")
     print(f"Market Sentiment:     {sentiment.upper()}")
     
     # OI Distribution
-    oi_dist = oi_analyzer.calculate_oi_distribution(option_chain, spot)
+    oi_dist = oi_analyzer.calculate_oi_distribution(chain, spot)
     print(f"\nOI Distribution:")
     print(f"  Total Call OI:  {oi_dist['total_call_oi']:,.0f}")
     print(f"  Total Put OI:   {oi_dist['total_put_oi']:,.0f}")
@@ -172,7 +191,7 @@ def main():
     print(f"  OTM Put OI:     {oi_dist['otm_put_oi']:,.0f} ({oi_dist['otm_put_oi_pct']:.1f}%)")
     
     # Call/Put Walls
-    walls = oi_analyzer.find_call_put_walls(option_chain, num_walls=3)
+    walls = oi_analyzer.find_call_put_walls(chain, num_walls=3)
     print(f"\nCall Walls (Resistance):")
     for i, wall in enumerate(walls['call_walls'], 1):
         print(f"  {i}. Strike: ₹{wall['strike']:.0f}, OI: {wall['call_oi']:,.0f}")
@@ -1,18 +1,39 @@
 """Script to download historical data."""
 
 import argparse
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 import sys
 
+import pandas as pd
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data.collectors.nse_scraper import NSEDataCollector
+from data.collectors.nse_scraper import AsyncNSEDataCollector
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+async def download_all(
+    dates: List[datetime], output_dir: str, max_concurrent: Optional[int] = None
+) -> List[Optional[Path]]:
+    """Download Bhavcopies for all dates with bounded concurrency.
+
+    Args:
+        dates: Dates to download
+        output_dir: Directory to save the files
+        max_concurrent: Maximum concurrent downloads (default from settings)
+
+    Returns:
+        Paths to the downloaded files (None for failed dates)
+    """
+    async with AsyncNSEDataCollector(max_concurrent=max_concurrent) as collector:
+        return await collector.download_bhavcopies(dates, output_dir)
+
+
 def main():
     """Download historical Bhavcopy data."""
     parser = argparse.ArgumentParser(description="Download historical NSE data")
@@ -34,6 +55,12 @@ def main():
         default="data/raw",
         help="Output directory for downloaded files",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Maximum concurrent downloads (defaults to NSE_MAX_CONCURRENT)",
+    )
     
     args = parser.parse_args()
     
@@ -49,27 +76,14 @@ def main():
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Initialize collector
-    collector = NSEDataCollector()
+    # Trading days to fetch (weekdays only; exchange holidays simply fail)
+    dates = list(pd.bdate_range(start_date, end_date).to_pydatetime())
     
-    # Download data for each date
-    current_date = start_date
-    success_count = 0
-    fail_count = 0
+    # Download concurrently; the collector bounds in-flight requests
+    paths = asyncio.run(download_all(dates, str(output_dir), args.max_concurrent))
     
-    while current_date <= end_date:
-        # Skip weekends
-        if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-            logger.info(f"Downloading data for {current_date.strftime('%Y-%m-%d')}")
-            
-            result = collector.download_bhavcopy(current_date, str(output_dir))
-            
-            if result:
-                success_count += 1
-            else:
-                fail_count += 1
-        
-        current_date += timedelta(days=1)
+    success_count = sum(path is not None for path in paths)
+    fail_count = len(paths) - success_count
     
     logger.info(f"Download complete. Success: {success_count}, Failed: {fail_count}")
 
@@ -1,9 +1,14 @@
 """Script to run backtests."""
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List
 import sys
 
+import pandas as pd
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.logging_config import get_logger
@@ -11,6 +16,38 @@ from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def shard_instruments(instruments: List[str], num_shards: int) -> List[List[str]]:
+    """Split instruments into round-robin shards, one per worker.
+
+    Args:
+        instruments: Instrument symbols
+        num_shards: Number of shards
+
+    Returns:
+        Non-empty shards
+    """
+    shards = [instruments[i::num_shards] for i in range(num_shards)]
+    return [shard for shard in shards if shard]
+
+
+def run_single_backtest(instruments: List[str], args: argparse.Namespace) -> List[dict]:
+    """Backtest one shard of instruments.
+
+    Backtest state is per instrument, so shards run in separate processes
+    without sharing anything.
+
+    Args:
+        instruments: Instruments in this shard
+        args: Parsed command line arguments
+
+    Returns:
+        Result rows for the shard
+    """
+    # TODO: Implement backtest execution
+    logger.info(f"Backtesting {args.strategy} on {', '.join(instruments)}")
+    return []
+
+
 def main():
     """Run backtest for a strategy."""
     parser = argparse.ArgumentParser(description="Run strategy backtest")
@@ -38,6 +75,18 @@ def main():
         default=1000000,
         help="Initial capital (default: 1000000)",
     )
+    parser.add_argument(
+        "--instruments",
+        type=str,
+        default="NIFTY",
+        help="Comma-separated instruments to backtest (default: NIFTY)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes (default: CPU count)",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -51,12 +100,30 @@ def main():
     logger.info(f"Period: {args.start} to {args.end}")
     logger.info(f"Initial Capital: ₹{args.capital:,.0f}")
     
-    # TODO: Implement backtest execution
+    instruments = [s.strip() for s in args.instruments.split(",") if s.strip()]
+    if not instruments:
+        parser.error("--instruments must name at least one instrument")
+    
+    # More workers than cores only adds process overhead
+    workers = min(max(1, args.workers or 1), os.cpu_count() or 1)
+    shards = shard_instruments(instruments, workers)
+    
+    # Instruments are independent, so each shard runs in its own process
+    results = []
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        for rows in executor.map(run_single_backtest, shards, [args] * len(shards)):
+            results.extend(rows)
+    
+    if results:
+        pd.DataFrame(results).to_csv(args.output, index=False)
+        logger.info(f"Wrote {len(results)} result rows to {args.output}")
+    
     logger.warning("Backtest execution not yet implemented")
     logger.info("This is a placeholder script for future implementation")
     
     print("\nBacktest Configuration:")
     print(f"  Strategy: {args.strategy}")
+    print(f"  Instruments: {', '.join(instruments)}")
     print(f"  Period: {args.start} to {args.end}")
     print(f"  Capital: ₹{args.capital:,.0f}")
     print(f"  Output: {args.output}")
@@ -1,19 +1,28 @@
 """Base strategy class."""
 
+import itertools
+import operator
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
-import pandas as pd
+import numpy as np
 
 from config.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
+# Growth step (in positions) for the open-position price arrays
+POSITION_CHUNK = 1024
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Signal:
-    """Trading signal."""
+    """Trading signal (immutable once generated)."""
 
     timestamp: datetime
     signal_type: str  # 'buy', 'sell', 'hold'
@@ -28,7 +37,7 @@ class Signal:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Trading position."""
 
@@ -42,7 +51,7 @@ class Position:
     current_price: float = 0.0
     unrealized_pnl: float = 0.0
     realized_pnl: float = 0.0
-    status: str = "open"  # 'open', 'closed'
+    is_open: bool = True
 
 
 class BaseStrategy(ABC):
@@ -59,10 +68,21 @@ class BaseStrategy(ABC):
         self.signals: List[Signal] = []
         self.pnl_history: List[Dict] = []
 
+        # Open positions by id and closed positions in close order, so
+        # per-bar work scales with open positions rather than history
+        self._open: Dict[str, Position] = {}
+        self._closed: List[Position] = []
+        self._realized_total = 0.0
+        self._init_open_arrays()
+
+        # Position ids: one clock read per strategy, then a counter per signal
+        self._run_id = time.time_ns()
+        self._position_seq = itertools.count(1)
+
     @abstractmethod
     def generate_signals(
         self,
-        option_chain: pd.DataFrame,
+        option_chain: "pd.DataFrame",
         spot: float,
         market_data: Dict,
     ) -> List[Signal]:
@@ -114,14 +134,24 @@ class BaseStrategy(ABC):
         """
         new_positions = []
 
-        for signal in signals:
-            if signal.signal_type == "buy":
-                position = self._open_position(signal)
-                if position:
-                    new_positions.append(position)
-                    self.positions.append(position)
-            elif signal.signal_type == "sell":
-                self._close_positions(signal)
+        # Handle consecutive runs of the same signal type in bulk; runs stay
+        # in order, so a sell only closes positions opened before it
+        for signal_type, run in itertools.groupby(
+            signals, key=operator.attrgetter("signal_type")
+        ):
+            if signal_type == "buy":
+                opened = [
+                    position
+                    for position in map(self._open_position, run)
+                    if position
+                ]
+                new_positions.extend(opened)
+                self.positions.extend(opened)
+                for position in opened:
+                    self._add_open(position)
+            elif signal_type == "sell":
+                for signal in run:
+                    self._close_positions(signal)
 
         return new_positions
 
@@ -135,7 +165,9 @@ class BaseStrategy(ABC):
             Position object or None
         """
         position = Position(
-            position_id=f"{signal.symbol}_{signal.strike}_{datetime.now().timestamp()}",
+            position_id=(
+                f"{signal.symbol}_{signal.strike}_{self._run_id}_{next(self._position_seq)}"
+            ),
             symbol=signal.symbol,
             strike=signal.strike or 0,
             option_type=signal.option_type or "call",
@@ -144,7 +176,7 @@ class BaseStrategy(ABC):
             entry_time=signal.timestamp,
         )
 
-        logger.info(f"Opened position: {position.position_id}")
+        logger.info("Opened position: %s", position.position_id)
         return position
 
     def _close_positions(self, signal: Signal):
@@ -153,13 +185,19 @@ class BaseStrategy(ABC):
         Args:
             signal: Trading signal
         """
-        for position in self.positions:
-            if position.status == "open" and position.symbol == signal.symbol:
-                position.status = "closed"
-                position.realized_pnl = (
-                    (signal.entry_price or 0) - position.entry_price
-                ) * position.quantity
-                logger.info(f"Closed position: {position.position_id}, P&L: {position.realized_pnl}")
+        matches = [p for p in self._open.values() if p.symbol == signal.symbol]
+        for position in matches:
+            self._remove_open(position)
+            self._closed.append(position)
+            position.is_open = False
+            position.realized_pnl = (
+                (signal.entry_price or 0) - position.entry_price
+            ) * position.quantity
+            # Closed positions are final, so the running total stays exact
+            self._realized_total += position.realized_pnl
+            logger.info(
+                "Closed position: %s, P&L: %s", position.position_id, position.realized_pnl
+            )
 
     def calculate_pnl(self, current_prices: Dict[str, float]) -> float:
         """Calculate total P&L.
@@ -170,26 +208,31 @@ class BaseStrategy(ABC):
         Returns:
             Total P&L
         """
-        total_pnl = 0.0
-
-        for position in self.positions:
-            if position.status == "open":
-                current_price = current_prices.get(position.position_id, position.entry_price)
-                position.current_price = current_price
-                position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
-                total_pnl += position.unrealized_pnl
-            else:
-                total_pnl += position.realized_pnl
+        n = len(self._open_ids)
+        entry = self._entry_prices[:n]
+        current = self._current_prices[:n]
+        current[:] = np.fromiter(
+            (
+                current_prices.get(position_id, price)
+                for position_id, price in zip(self._open_ids, entry.tolist())
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        self._unrealized[:n] = (current - entry) * self._quantities[:n]
 
-        return total_pnl
+        return float(self._unrealized[:n].sum()) + self._realized_total
 
     def get_open_positions(self) -> List[Position]:
         """Get list of open positions.
 
         Returns:
-            List of open positions
+            List of open positions (with current price and unrealized P&L
+            as of the last calculate_pnl call)
         """
-        return [p for p in self.positions if p.status == "open"]
+        for position in self._open.values():
+            self._sync_position(position)
+        return list(self._open.values())
 
     def get_closed_positions(self) -> List[Position]:
         """Get list of closed positions.
@@ -197,11 +240,79 @@ class BaseStrategy(ABC):
         Returns:
             List of closed positions
         """
-        return [p for p in self.positions if p.status == "closed"]
+        return list(self._closed)
+
+    def _init_open_arrays(self):
+        """Allocate the struct-of-arrays view of open positions.
+
+        Row i of each array belongs to position _open_ids[i]; calculate_pnl
+        works on these arrays and Position objects are updated lazily.
+        """
+        self._open_ids: List[str] = []
+        self._open_rows: Dict[str, int] = {}
+        self._entry_prices = np.empty(POSITION_CHUNK)
+        self._quantities = np.empty(POSITION_CHUNK)
+        self._current_prices = np.empty(POSITION_CHUNK)
+        self._unrealized = np.empty(POSITION_CHUNK)
+
+    def _add_open(self, position: Position):
+        """Track a newly opened position.
+
+        Args:
+            position: Opened position
+        """
+        row = len(self._open_ids)
+        if row == self._entry_prices.shape[0]:
+            for name in ("_entry_prices", "_quantities", "_current_prices", "_unrealized"):
+                grown = np.empty(row + POSITION_CHUNK)
+                grown[:row] = getattr(self, name)
+                setattr(self, name, grown)
+
+        self._open[position.position_id] = position
+        self._open_ids.append(position.position_id)
+        self._open_rows[position.position_id] = row
+        self._entry_prices[row] = position.entry_price
+        self._quantities[row] = position.quantity
+        self._current_prices[row] = position.entry_price
+        self._unrealized[row] = 0.0
+
+    def _remove_open(self, position: Position):
+        """Stop tracking an open position (swap-removes its array row).
+
+        Args:
+            position: Position being closed
+        """
+        self._sync_position(position)
+        del self._open[position.position_id]
+
+        row = self._open_rows.pop(position.position_id)
+        last = len(self._open_ids) - 1
+        last_id = self._open_ids.pop()
+        if row != last:
+            self._open_ids[row] = last_id
+            self._open_rows[last_id] = row
+            for array in (
+                self._entry_prices, self._quantities, self._current_prices, self._unrealized
+            ):
+                array[row] = array[last]
+
+    def _sync_position(self, position: Position):
+        """Copy the array-held price and P&L back onto an open position.
+
+        Args:
+            position: Open position
+        """
+        row = self._open_rows[position.position_id]
+        position.current_price = float(self._current_prices[row])
+        position.unrealized_pnl = float(self._unrealized[row])
 
     def reset(self):
         """Reset strategy state."""
         self.positions = []
         self.signals = []
         self.pnl_history = []
-        logger.info(f"Strategy {self.name} reset")
+        self._open = {}
+        self._closed = []
+        self._realized_total = 0.0
+        self._init_open_arrays()
+        logger.info("Strategy %s reset", self.name)
@@ -5,35 +5,56 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from features.gex_calculator import GammaExposureCalculator
+from features.greeks_calculator import GreeksCalculator
+from features.max_pain import MaxPainCalculator
+from features.oi_analysis import OIAnalyzer
 
-@pytest.fixture
-def sample_option_chain():
-    """Sample option chain data for testing."""
+# Shallow copies share column buffers until written (always on in pandas 3)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Seed for all fixture data, so every pytest-xdist worker builds the same inputs
+SEED = 42
+
+
+@pytest.fixture(scope="session")
+def _sample_option_chain_base():
+    """Sample option chain built once per test session."""
     strikes = np.arange(19000, 20000, 100)
+    n = len(strikes)
+    rng = np.random.default_rng(SEED)
     
-    data = []
-    for strike in strikes:
-        data.append({
-            "strike": strike,
-            "expiry_date": "2024-12-31",
-            "call_oi": np.random.randint(100, 10000),
-            "call_volume": np.random.randint(10, 1000),
-            "call_ltp": np.random.uniform(50, 500),
-            "call_iv": np.random.uniform(0.15, 0.25),
-            "put_oi": np.random.randint(100, 10000),
-            "put_volume": np.random.randint(10, 1000),
-            "put_ltp": np.random.uniform(50, 500),
-            "put_iv": np.random.uniform(0.15, 0.25),
-        })
+    df = pd.DataFrame({
+        "strike": strikes,
+        "expiry_date": "2024-12-31",
+        "call_oi": rng.integers(100, 10000, n),
+        "call_volume": rng.integers(10, 1000, n),
+        "call_ltp": rng.uniform(50, 500, n),
+        "call_iv": rng.uniform(0.15, 0.25, n),
+        "put_oi": rng.integers(100, 10000, n),
+        "put_volume": rng.integers(10, 1000, n),
+        "put_ltp": rng.uniform(50, 500, n),
+        "put_iv": rng.uniform(0.15, 0.25, n),
+    })
     
-    df = pd.DataFrame(data)
     df.attrs["underlying"] = 19500
-    df.attrs["timestamp"] = datetime.now().isoformat()
+    df.attrs["timestamp"] = datetime(2024, 12, 24, 15, 30).isoformat()
     df.attrs["symbol"] = "NIFTY"
     
     return df
 
 
+@pytest.fixture
+def sample_option_chain(_sample_option_chain_base):
+    """Sample option chain data for testing.
+
+    A shallow copy of the session chain: cheap to make, and with
+    copy-on-write a test that modifies it does not affect other tests.
+    """
+    return _sample_option_chain_base.copy(deep=False)
+
+
 @pytest.fixture
 def sample_spot_price():
     """Sample spot price for testing."""
@@ -46,6 +67,12 @@ def sample_strike():
     return 19500.0
 
 
+@pytest.fixture
+def sample_strikes():
+    """Sample strike array around the spot for vectorized tests."""
+    return np.linspace(18500, 20500, 50)
+
+
 @pytest.fixture
 def sample_volatility():
     """Sample volatility for testing."""
@@ -56,3 +83,27 @@ def sample_volatility():
 def sample_time_to_expiry():
     """Sample time to expiry for testing."""
     return 7 / 365.0  # 7 days
+
+
+@pytest.fixture(scope="session")
+def greeks_calc():
+    """Greeks calculator shared by the whole session (it holds no state)."""
+    return GreeksCalculator()
+
+
+@pytest.fixture(scope="session")
+def gex_calc(greeks_calc):
+    """GEX calculator shared by the whole session."""
+    return GammaExposureCalculator(greeks_calc)
+
+
+@pytest.fixture(scope="session")
+def max_pain_calc():
+    """Max Pain calculator shared by the whole session."""
+    return MaxPainCalculator()
+
+
+@pytest.fixture(scope="session")
+def oi_analyzer():
+    """OI analyzer shared by the whole session."""
+    return OIAnalyzer()
@@ -0,0 +1,106 @@
+"""Tests for the base strategy position bookkeeping."""
+
+import pytest
+from datetime import datetime
+from strategies.base_strategy import BaseStrategy, Signal
+
+
+class DummyStrategy(BaseStrategy):
+    """Minimal concrete strategy for exercising BaseStrategy."""
+
+    def generate_signals(self, option_chain, spot, market_data):
+        return []
+
+    def entry_criteria(self, market_data):
+        return True
+
+    def exit_criteria(self, position, market_data):
+        return False
+
+
+def _signal(signal_type, symbol="NIFTY", strike=19500.0, price=100.0, quantity=50):
+    return Signal(
+        timestamp=datetime(2025, 1, 2, 9, 15),
+        signal_type=signal_type,
+        symbol=symbol,
+        strike=strike,
+        option_type="call",
+        quantity=quantity,
+        entry_price=price,
+    )
+
+
+class TestBaseStrategy:
+    """Test suite for BaseStrategy."""
+
+    def test_open_and_close_positions(self):
+        """Test buys open positions and sells close them by symbol."""
+        strategy = DummyStrategy("dummy")
+
+        opened = strategy.execute(
+            [_signal("buy"), _signal("buy", strike=19600.0), _signal("buy", symbol="BANKNIFTY")]
+        )
+
+        assert len(opened) == 3
+        assert len({p.position_id for p in opened}) == 3
+        assert len(strategy.get_open_positions()) == 3
+        assert all(p.is_open for p in opened)
+
+        strategy.execute([_signal("sell", price=120.0)])
+
+        closed = strategy.get_closed_positions()
+        assert [p.strike for p in closed] == [19500.0, 19600.0]
+        assert [p.symbol for p in strategy.get_open_positions()] == ["BANKNIFTY"]
+        assert all(p.realized_pnl == pytest.approx(20.0 * 50) for p in closed)
+        assert not any(p.is_open for p in closed)
+
+    def test_sell_only_closes_earlier_buys(self):
+        """Test signals are applied in order within one execute call."""
+        strategy = DummyStrategy("dummy")
+
+        strategy.execute([_signal("buy"), _signal("sell", price=110.0), _signal("buy", strike=19600.0)])
+
+        assert [p.strike for p in strategy.get_closed_positions()] == [19500.0]
+        assert [p.strike for p in strategy.get_open_positions()] == [19600.0]
+
+    def test_calculate_pnl(self):
+        """Test total P&L combines realized and unrealized P&L."""
+        strategy = DummyStrategy("dummy")
+        strategy.execute([_signal("buy"), _signal("buy", symbol="BANKNIFTY", price=200.0)])
+        strategy.execute([_signal("sell", price=90.0)])
+
+        position_id = strategy.get_open_positions()[0].position_id
+        total = strategy.calculate_pnl({position_id: 210.0})
+
+        # Realized: (90 - 100) * 50; unrealized: (210 - 200) * 50
+        assert total == pytest.approx(-500.0 + 500.0)
+        open_position = strategy.get_open_positions()[0]
+        assert open_position.current_price == pytest.approx(210.0)
+        assert open_position.unrealized_pnl == pytest.approx(500.0)
+
+    def test_pnl_after_many_opens_and_closes(self):
+        """Test P&L stays consistent as positions grow past one chunk and close."""
+        strategy = DummyStrategy("dummy")
+        signals = [
+            _signal("buy", symbol=f"S{i % 7}", strike=float(i), price=float(i % 13), quantity=1)
+            for i in range(2500)
+        ]
+        strategy.execute(signals)
+        strategy.execute([_signal("sell", symbol="S3", price=5.0)])
+
+        prices = {p.position_id: p.entry_price + 1.0 for p in strategy.get_open_positions()}
+        total = strategy.calculate_pnl(prices)
+
+        expected_realized = sum(5.0 - p.entry_price for p in strategy.get_closed_positions())
+        assert total == pytest.approx(len(prices) + expected_realized)
+        assert all(p.unrealized_pnl == 1.0 for p in strategy.get_open_positions())
+
+    def test_reset(self):
+        """Test reset clears all positions and realized P&L."""
+        strategy = DummyStrategy("dummy")
+        strategy.execute([_signal("buy"), _signal("sell", price=120.0), _signal("buy")])
+        strategy.reset()
+
+        assert strategy.get_open_positions() == []
+        assert strategy.get_closed_positions() == []
+        assert strategy.calculate_pnl({}) == 0.0
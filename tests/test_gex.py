@@ -1,17 +1,16 @@
 """Tests for GEX calculator."""
 
 import pytest
-from features.gex_calculator import GammaExposureCalculator
+import numpy as np
 
 
 class TestGEXCalculator:
     """Test suite for GEX calculator."""
 
-    def test_calculate_strike_gex(self):
+    def test_calculate_strike_gex(self, gex_calc):
         """Test GEX calculation for a single strike."""
-        calc = GammaExposureCalculator()
         
-        gex = calc.calculate_strike_gex(
+        gex = gex_calc.calculate_strike_gex(
             spot=19500,
             strike=19500,
             call_oi=1000,
@@ -34,11 +33,10 @@ class TestGEXCalculator:
         # Net GEX is sum of both
         assert abs(gex["net_gex"] - (gex["call_gex"] + gex["put_gex"])) < 0.01
 
-    def test_calculate_chain_gex(self, sample_option_chain, sample_spot_price):
+    def test_calculate_chain_gex(self, gex_calc, sample_option_chain, sample_spot_price):
         """Test GEX calculation for entire chain."""
-        calc = GammaExposureCalculator()
         
-        gex_df = calc.calculate_chain_gex(
+        gex_df = gex_calc.calculate_chain_gex(
             option_chain=sample_option_chain,
             spot=sample_spot_price,
             days_to_expiry=7,
@@ -52,17 +50,42 @@ class TestGEXCalculator:
         assert "net_gex" in gex_df.columns
         assert "cumulative_gex" in gex_df.columns
 
-    def test_find_gex_levels(self, sample_option_chain, sample_spot_price):
+    def test_chain_gex_columns_contiguous(self, gex_calc, sample_option_chain, sample_spot_price):
+        """Test that GEX columns are stored column-major for fast reductions."""
+
+        gex_df = gex_calc.calculate_chain_gex(
+            option_chain=sample_option_chain,
+            spot=sample_spot_price,
+            days_to_expiry=7,
+        )
+
+        for column in gex_df.columns:
+            assert gex_df[column].to_numpy().flags["C_CONTIGUOUS"]
+
+    def test_chain_gex_dtypes(self, gex_calc, sample_option_chain, sample_spot_price):
+        """Test that OI stays integral and gamma/GEX use single precision."""
+
+        gex_df = gex_calc.calculate_chain_gex(
+            option_chain=sample_option_chain,
+            spot=sample_spot_price,
+            days_to_expiry=7,
+        )
+
+        assert gex_df["call_oi"].dtype == np.int64
+        assert gex_df["put_oi"].dtype == np.int64
+        for column in ("call_gamma", "put_gamma", "call_gex", "put_gex", "net_gex", "cumulative_gex"):
+            assert gex_df[column].dtype == np.float32
+
+    def test_find_gex_levels(self, gex_calc, sample_option_chain, sample_spot_price):
         """Test finding key GEX levels."""
-        calc = GammaExposureCalculator()
         
-        gex_df = calc.calculate_chain_gex(
+        gex_df = gex_calc.calculate_chain_gex(
             option_chain=sample_option_chain,
             spot=sample_spot_price,
             days_to_expiry=7,
         )
         
-        levels = calc.find_gex_levels(gex_df, sample_spot_price)
+        levels = gex_calc.find_gex_levels(gex_df, sample_spot_price)
         
         assert "gex_regime" in levels
         assert levels["gex_regime"] in ["positive", "negative"]
@@ -72,19 +95,55 @@ class TestGEXCalculator:
         assert "flip_levels" in levels
         assert isinstance(levels["flip_levels"], list)
 
-    def test_gex_profile(self, sample_option_chain, sample_spot_price):
+    def test_gex_profile(self, gex_calc, sample_option_chain, sample_spot_price):
         """Test GEX profile calculation."""
-        calc = GammaExposureCalculator()
         
-        gex_df = calc.calculate_chain_gex(
+        gex_df = gex_calc.calculate_chain_gex(
             option_chain=sample_option_chain,
             spot=sample_spot_price,
             days_to_expiry=7,
         )
         
-        profile = calc.calculate_gex_profile(gex_df)
+        profile = gex_calc.calculate_gex_profile(gex_df)
         
         assert "net_gex" in profile
         assert "call_gex" in profile
         assert "put_gex" in profile
         assert "cumulative_gex" in profile
+
+    def test_chain_gex_with_context(self, gex_calc, sample_option_chain, sample_spot_price):
+        """Test a shared ChainContext gives the same GEX as building one inline."""
+        context = gex_calc.greeks_calculator.chain_context(
+            sample_spot_price,
+            sample_option_chain["strike"].to_numpy(),
+            7 / 365.0,
+            dtype=np.float32,
+        )
+
+        expected = gex_calc.calculate_chain_gex(sample_option_chain, sample_spot_price, 7)
+        gex_df = gex_calc.calculate_chain_gex(
+            sample_option_chain, sample_spot_price, 7, context=context
+        )
+
+        np.testing.assert_array_equal(gex_df["net_gex"], expected["net_gex"])
+
+    def test_chain_gex_rejects_mismatched_context(self, gex_calc, sample_option_chain, sample_spot_price):
+        """Test a context for other strikes or another expiry is rejected."""
+        wide = gex_calc.greeks_calculator.chain_context(
+            sample_spot_price, np.linspace(15000, 25000, 1000), 7 / 365.0, dtype=np.float32
+        )
+        with pytest.raises(ValueError, match="strikes"):
+            gex_calc.calculate_chain_gex(
+                sample_option_chain, sample_spot_price, 7, context=wide
+            )
+
+        other_expiry = gex_calc.greeks_calculator.chain_context(
+            sample_spot_price,
+            sample_option_chain["strike"].to_numpy(),
+            14 / 365.0,
+            dtype=np.float32,
+        )
+        with pytest.raises(ValueError, match="days_to_expiry"):
+            gex_calc.calculate_chain_gex(
+                sample_option_chain, sample_spot_price, 7, context=other_expiry
+            )
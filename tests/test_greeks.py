@@ -1,98 +1,66 @@
 """Tests for Greeks calculator."""
 
+import math
 import pytest
 import numpy as np
-from features.greeks_calculator import GreeksCalculator
 
 
 class TestGreeksCalculator:
     """Test suite for Greeks calculator."""
 
-    def test_call_price(self, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
-        """Test call option pricing."""
-        calc = GreeksCalculator()
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_option_price(self, greeks_calc, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility, option_type):
+        """Test scalar call and put pricing."""
+        price_fn = greeks_calc.call_price if option_type == "call" else greeks_calc.put_price
         
-        call_price = calc.call_price(
+        price = price_fn(
             spot=sample_spot_price,
             strike=sample_strike,
             time_to_expiry=sample_time_to_expiry,
             volatility=sample_volatility,
         )
         
-        assert call_price > 0
-        assert isinstance(call_price, float)
+        assert price > 0
+        assert isinstance(price, float)
 
-    def test_put_price(self, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
-        """Test put option pricing."""
-        calc = GreeksCalculator()
+    @pytest.mark.parametrize("time_to_expiry", [1 / 365, 7 / 365, 30 / 365])
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_greeks_bounds(self, greeks_calc, sample_spot_price, sample_strikes, sample_volatility, time_to_expiry, option_type):
+        """Test Greeks signs and bounds across a whole strike array."""
         
-        put_price = calc.put_price(
-            spot=sample_spot_price,
-            strike=sample_strike,
-            time_to_expiry=sample_time_to_expiry,
-            volatility=sample_volatility,
-        )
-        
-        assert put_price > 0
-        assert isinstance(put_price, float)
-
-    def test_call_greeks(self, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
-        """Test call option Greeks calculation."""
-        calc = GreeksCalculator()
-        
-        greeks = calc.calculate_greeks(
-            spot=sample_spot_price,
-            strike=sample_strike,
-            time_to_expiry=sample_time_to_expiry,
-            volatility=sample_volatility,
-            option_type="call",
+        greeks = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, sample_strikes, time_to_expiry, sample_volatility, option_type
         )
         
-        # Delta should be between 0 and 1 for calls
-        assert 0 <= greeks.delta <= 1
+        # Scalar volatility broadcasts over the strikes
+        for values in greeks.values():
+            assert values.shape == sample_strikes.shape
         
-        # Gamma should be positive
-        assert greeks.gamma > 0
+        assert np.all(greeks["price"] >= 0)
         
-        # Vega should be positive
-        assert greeks.vega > 0
+        if option_type == "call":
+            # Delta between 0 and 1; theta negative for long calls
+            assert np.all((greeks["delta"] >= 0) & (greeks["delta"] <= 1))
+            assert np.all(greeks["theta"] < 0)
+        else:
+            # Delta between -1 and 0
+            assert np.all((greeks["delta"] >= -1) & (greeks["delta"] <= 0))
         
-        # Theta should be negative for long options
-        assert greeks.theta < 0
+        # Gamma and vega positive for calls and puts
+        assert np.all(greeks["gamma"] > 0)
+        assert np.all(greeks["vega"] > 0)
 
-    def test_put_greeks(self, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
-        """Test put option Greeks calculation."""
-        calc = GreeksCalculator()
-        
-        greeks = calc.calculate_greeks(
-            spot=sample_spot_price,
-            strike=sample_strike,
-            time_to_expiry=sample_time_to_expiry,
-            volatility=sample_volatility,
-            option_type="put",
-        )
-        
-        # Delta should be between -1 and 0 for puts
-        assert -1 <= greeks.delta <= 0
-        
-        # Gamma should be positive
-        assert greeks.gamma > 0
-        
-        # Vega should be positive
-        assert greeks.vega > 0
-
-    def test_put_call_parity(self, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
+    def test_put_call_parity(self, greeks_calc, sample_spot_price, sample_strike, sample_time_to_expiry, sample_volatility):
         """Test put-call parity relationship."""
-        calc = GreeksCalculator()
         
-        call_price = calc.call_price(
+        call_price = greeks_calc.call_price(
             spot=sample_spot_price,
             strike=sample_strike,
             time_to_expiry=sample_time_to_expiry,
             volatility=sample_volatility,
         )
         
-        put_price = calc.put_price(
+        put_price = greeks_calc.put_price(
             spot=sample_spot_price,
             strike=sample_strike,
             time_to_expiry=sample_time_to_expiry,
@@ -100,19 +68,18 @@ class TestGreeksCalculator:
         )
         
         # Put-Call Parity: C - P = S - K*e^(-rT)
-        pv_strike = sample_strike * np.exp(-calc.risk_free_rate * sample_time_to_expiry)
+        pv_strike = sample_strike * math.exp(-greeks_calc.risk_free_rate * sample_time_to_expiry)
         parity_lhs = call_price - put_price
         parity_rhs = sample_spot_price - pv_strike
         
         assert abs(parity_lhs - parity_rhs) < 0.01  # Allow small numerical error
 
-    def test_implied_volatility(self, sample_spot_price, sample_strike, sample_time_to_expiry):
+    def test_implied_volatility(self, greeks_calc, sample_spot_price, sample_strike, sample_time_to_expiry):
         """Test implied volatility calculation."""
-        calc = GreeksCalculator()
         
         # Calculate a theoretical price with known volatility
         known_volatility = 0.25
-        market_price = calc.call_price(
+        market_price = greeks_calc.call_price(
             spot=sample_spot_price,
             strike=sample_strike,
             time_to_expiry=sample_time_to_expiry,
@@ -120,7 +87,7 @@ class TestGreeksCalculator:
         )
         
         # Calculate implied volatility
-        iv = calc.implied_volatility(
+        iv = greeks_calc.implied_volatility(
             market_price=market_price,
             spot=sample_spot_price,
             strike=sample_strike,
@@ -130,3 +97,156 @@ class TestGreeksCalculator:
         
         assert iv is not None
         assert abs(iv - known_volatility) < 0.01  # Should converge to known volatility
+
+    @pytest.mark.parametrize("time_to_expiry", [0.0, -1 / 365])
+    def test_implied_volatility_rejects_expired(self, greeks_calc, time_to_expiry):
+        """Test implied volatility rejects a non-positive time to expiry."""
+        with pytest.raises(ValueError, match="Time to expiry must be positive"):
+            greeks_calc.implied_volatility(100.0, 19500.0, 19500.0, time_to_expiry)
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    @pytest.mark.parametrize("volatility", [0.0, -0.1, float("nan")])
+    def test_greeks_zero_volatility(self, greeks_calc, sample_spot_price, sample_time_to_expiry, option_type, volatility):
+        """Test a zero or missing volatility gives the zero-volatility limit."""
+        for strike in (19000.0, 20000.0):
+            result = greeks_calc.calculate_greeks(
+                sample_spot_price, strike, sample_time_to_expiry, volatility, option_type
+            )
+            limit = greeks_calc.calculate_greeks(
+                sample_spot_price, strike, sample_time_to_expiry, 1e-6, option_type
+            )
+
+            assert result.gamma == 0.0
+            assert result.vega == 0.0
+            for name in ("price", "delta", "theta", "rho"):
+                assert getattr(result, name) == pytest.approx(getattr(limit, name))
+
+    def test_gamma_vec_matches_scalar(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test vectorized gamma against the scalar Greeks."""
+        strikes = np.array([19800.0, 20000.0, 20200.0, 20400.0])
+        vols = np.array([0.18, 0.2, 0.0, 0.22])
+
+        gammas = greeks_calc.calculate_gamma_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols
+        )
+
+        assert gammas[2] == 0
+        for strike, vol, gamma in zip(strikes, vols, gammas):
+            if vol > 0:
+                expected = greeks_calc.calculate_greeks(
+                    spot=sample_spot_price,
+                    strike=strike,
+                    time_to_expiry=sample_time_to_expiry,
+                    volatility=vol,
+                    option_type="call",
+                ).gamma
+                assert gamma == pytest.approx(expected)
+
+    def test_gamma_vec_rejects_mismatched_lengths(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test vols or out of the wrong length are rejected before the kernel runs."""
+        strikes = np.array([19800.0, 20000.0, 20200.0, 20400.0])
+
+        with pytest.raises(ValueError, match="must match strikes"):
+            greeks_calc.calculate_gamma_vec(
+                sample_spot_price, strikes, sample_time_to_expiry, np.full(2, 0.2)
+            )
+        with pytest.raises(ValueError, match="must match strikes"):
+            greeks_calc.calculate_gamma_vec(
+                sample_spot_price, strikes, sample_time_to_expiry, np.full(4, 0.2), out=np.empty(1)
+            )
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_greeks_vec_matches_scalar(self, greeks_calc, sample_spot_price, sample_time_to_expiry, option_type):
+        """Test vectorized Greeks against the scalar calculation."""
+        strikes = np.array([19500.0, 19800.0, 20000.0, 20200.0, 20500.0])
+        vols = np.array([0.22, 0.2, 0.18, 0.19, 0.21])
+
+        greeks = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols, option_type
+        )
+
+        for i, (strike, vol) in enumerate(zip(strikes, vols)):
+            expected = greeks_calc.calculate_greeks(
+                spot=sample_spot_price,
+                strike=strike,
+                time_to_expiry=sample_time_to_expiry,
+                volatility=vol,
+                option_type=option_type,
+            )
+            for name in ("price", "delta", "gamma", "theta", "vega", "rho"):
+                assert greeks[name][i] == pytest.approx(getattr(expected, name), rel=1e-12)
+
+    def test_greeks_vec_invalid_volatility(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test zero, negative and NaN vols match the scalar zero-volatility limit."""
+        strikes = np.array([19000.0, 19500.0, 20000.0, 19000.0, 20000.0])
+        vols = np.array([0.2, 0.0, np.nan, -0.1, 0.0])
+        is_call = np.array([True, True, True, False, False])
+
+        context = greeks_calc.chain_context(sample_spot_price, strikes, sample_time_to_expiry)
+        greeks = greeks_calc.greeks_from_context(context, vols, is_call)
+
+        for i in range(len(strikes)):
+            expected = greeks_calc.calculate_greeks(
+                sample_spot_price,
+                strikes[i],
+                sample_time_to_expiry,
+                vols[i],
+                "call" if is_call[i] else "put",
+            )
+            for name in ("price", "delta", "gamma", "theta", "vega", "rho"):
+                assert np.isfinite(greeks[name][i])
+                assert greeks[name][i] == pytest.approx(getattr(expected, name), rel=1e-12)
+
+    def test_greeks_from_context_mixed_chain(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test a mixed call/put chain matches the single-type results."""
+        strikes = np.array([19500.0, 19800.0, 20000.0, 20200.0, 20500.0])
+        vols = np.array([0.22, 0.2, 0.18, 0.19, 0.21])
+        is_call = np.array([False, False, True, True, True])
+
+        context = greeks_calc.chain_context(sample_spot_price, strikes, sample_time_to_expiry)
+        mixed = greeks_calc.greeks_from_context(context, vols, is_call)
+        calls = greeks_calc.greeks_from_context(context, vols, True)
+        puts = greeks_calc.greeks_from_context(context, vols, False)
+
+        for name in ("price", "delta", "gamma", "theta", "vega", "rho"):
+            expected = np.where(is_call, calls[name], puts[name])
+            np.testing.assert_allclose(mixed[name], expected)
+
+    def test_greeks_vec_float32(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test the float32 path stays float32 and close to float64."""
+        strikes = np.arange(19000.0, 21000.0, 50.0)
+        vols = np.linspace(0.15, 0.3, strikes.size)
+
+        fp64 = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols
+        )
+        fp32 = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols, dtype=np.float32
+        )
+
+        for name in ("price", "delta", "gamma", "theta", "vega", "rho"):
+            assert fp32[name].dtype == np.float32
+            scale = np.abs(fp64[name]).max()
+            assert np.abs(fp32[name] - fp64[name]).max() <= 1e-4 * scale
+
+    def test_implied_volatility_vec(self, greeks_calc, sample_spot_price, sample_time_to_expiry):
+        """Test batch implied volatility on a mixed call/put chain."""
+        strikes = np.array([19600.0, 19800.0, 20000.0, 20200.0, 20400.0])
+        vols = np.array([0.24, 0.21, 0.18, 0.2, 0.23])
+        is_call = np.array([False, False, True, True, True])
+
+        prices = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols, "call"
+        )["price"]
+        puts = greeks_calc.calculate_greeks_vec(
+            sample_spot_price, strikes, sample_time_to_expiry, vols, "put"
+        )["price"]
+        prices = np.where(is_call, prices, puts)
+        prices[-1] = -1.0  # Below intrinsic value
+
+        ivs = greeks_calc.implied_volatility_vec(
+            prices, sample_spot_price, strikes, sample_time_to_expiry, is_call
+        )
+
+        np.testing.assert_allclose(ivs[:-1], vols[:-1], atol=1e-4)
+        assert np.isnan(ivs[-1])
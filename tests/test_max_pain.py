@@ -1,17 +1,17 @@
 """Tests for Max Pain calculator."""
 
 import pytest
-from features.max_pain import MaxPainCalculator
+import numpy as np
+from features.chain_arrays import to_chain_arrays
 
 
 class TestMaxPainCalculator:
     """Test suite for Max Pain calculator."""
 
-    def test_calculate_max_pain(self, sample_option_chain):
+    def test_calculate_max_pain(self, max_pain_calc, sample_option_chain):
         """Test Max Pain calculation."""
-        calc = MaxPainCalculator()
         
-        max_pain, pain_df = calc.calculate_max_pain(sample_option_chain)
+        max_pain, pain_df = max_pain_calc.calculate_max_pain(sample_option_chain)
         
         # Max Pain should be a valid strike
         assert max_pain in sample_option_chain["strike"].values
@@ -23,11 +23,28 @@ class TestMaxPainCalculator:
         assert "put_loss" in pain_df.columns
         assert "total_pain" in pain_df.columns
 
-    def test_find_support_resistance(self, sample_option_chain):
+    def test_max_pain_matches_brute_force(self, max_pain_calc, sample_option_chain):
+        """Test the prefix-sum pain curve against a direct summation."""
+        chain = sample_option_chain.sample(frac=1, random_state=0)
+
+        max_pain, pain_df = max_pain_calc.calculate_max_pain(chain, lot_size=50)
+
+        strikes = chain["strike"].to_numpy()
+        for row in pain_df.itertuples():
+            itm_calls = strikes < row.strike
+            itm_puts = strikes > row.strike
+            call_loss = ((row.strike - strikes) * chain["call_oi"].to_numpy())[itm_calls].sum() * 50
+            put_loss = ((strikes - row.strike) * chain["put_oi"].to_numpy())[itm_puts].sum() * 50
+            assert row.call_loss == pytest.approx(call_loss)
+            assert row.put_loss == pytest.approx(put_loss)
+
+        assert pain_df["strike"].is_monotonic_increasing
+        assert max_pain == pain_df.loc[pain_df["total_pain"].idxmin(), "strike"]
+
+    def test_find_support_resistance(self, max_pain_calc, sample_option_chain):
         """Test support/resistance level identification."""
-        calc = MaxPainCalculator()
         
-        levels = calc.find_support_resistance(sample_option_chain, num_levels=3)
+        levels = max_pain_calc.find_support_resistance(sample_option_chain, num_levels=3)
         
         assert "resistance" in levels
         assert "support" in levels
@@ -39,11 +56,10 @@ class TestMaxPainCalculator:
         for resistance in levels["resistance"]:
             assert resistance in sample_option_chain["strike"].values
 
-    def test_oi_concentration(self, sample_option_chain, sample_spot_price):
+    def test_oi_concentration(self, max_pain_calc, sample_option_chain, sample_spot_price):
         """Test OI concentration calculation."""
-        calc = MaxPainCalculator()
         
-        concentration = calc.calculate_oi_concentration(
+        concentration = max_pain_calc.calculate_oi_concentration(
             sample_option_chain,
             sample_spot_price,
             range_points=200
@@ -57,12 +73,11 @@ class TestMaxPainCalculator:
         # PCR should be positive
         assert concentration["near_spot_pcr"] >= 0
 
-    def test_pain_score(self, sample_option_chain, sample_spot_price):
+    def test_pain_score(self, max_pain_calc, sample_option_chain, sample_spot_price):
         """Test pain score calculation."""
-        calc = MaxPainCalculator()
         
-        max_pain, pain_df = calc.calculate_max_pain(sample_option_chain)
-        score = calc.calculate_pain_score(sample_spot_price, max_pain, pain_df)
+        max_pain, pain_df = max_pain_calc.calculate_max_pain(sample_option_chain)
+        score = max_pain_calc.calculate_pain_score(sample_spot_price, max_pain, pain_df)
         
         assert "distance_from_max_pain" in score
         assert "distance_percentage" in score
@@ -72,3 +87,24 @@ class TestMaxPainCalculator:
         
         # Pain score should be non-negative
         assert score["pain_score"] >= 0
+
+    def test_max_pain_accepts_chain_arrays(self, max_pain_calc, sample_option_chain):
+        """Test Max Pain gives the same result from a ChainArrays snapshot."""
+        
+        max_pain, pain_df = max_pain_calc.calculate_max_pain(sample_option_chain)
+        arrays_max_pain, arrays_pain_df = max_pain_calc.calculate_max_pain(
+            to_chain_arrays(sample_option_chain)
+        )
+        
+        assert arrays_max_pain == max_pain
+        assert np.allclose(arrays_pain_df["total_pain"], pain_df["total_pain"])
+
+    def test_support_resistance_accepts_chain_arrays(self, max_pain_calc, sample_option_chain):
+        """Test support/resistance levels match between DataFrame and ChainArrays."""
+        
+        levels = max_pain_calc.find_support_resistance(sample_option_chain, num_levels=3)
+        arrays_levels = max_pain_calc.find_support_resistance(
+            to_chain_arrays(sample_option_chain), num_levels=3
+        )
+        
+        assert arrays_levels == levels
@@ -0,0 +1,82 @@
+"""Tests for OI analysis."""
+
+import numpy as np
+import pandas as pd
+
+
+def _merge_oi_changes(current_chain, previous_chain):
+    """Reference OI changes computed with a full merge on strike."""
+    merged = current_chain.merge(
+        previous_chain,
+        on="strike",
+        suffixes=("_current", "_previous"),
+    )
+    merged["call_oi_change"] = merged["call_oi_current"] - merged["call_oi_previous"]
+    merged["put_oi_change"] = merged["put_oi_current"] - merged["put_oi_previous"]
+    merged["call_oi_change_pct"] = merged["call_oi_change"] / merged["call_oi_previous"] * 100
+    merged["put_oi_change_pct"] = merged["put_oi_change"] / merged["put_oi_previous"] * 100
+    merged = merged.replace([np.inf, -np.inf], 0).fillna(0)
+
+    return merged[
+        [
+            "strike",
+            "call_oi_current",
+            "put_oi_current",
+            "call_oi_change",
+            "put_oi_change",
+            "call_oi_change_pct",
+            "put_oi_change_pct",
+        ]
+    ]
+
+
+class TestOIAnalyzer:
+    """Test suite for OI analysis."""
+
+    def test_oi_changes_unique_strikes(self, oi_analyzer):
+        """Test the index-aligned path matches the merge, including missing OI."""
+        current = pd.DataFrame({
+            "strike": [19600.0, 19500.0, 19700.0, 19800.0, 20000.0],
+            "call_oi": [np.nan, 120.0, 0.0, 50.0, 10.0],
+            "put_oi": [30.0, np.nan, 40.0, 0.0, 10.0],
+        })
+        previous = pd.DataFrame({
+            "strike": [19500.0, 19600.0, 19700.0, 19800.0, 19900.0],
+            "call_oi": [100.0, 10.0, 0.0, np.nan, 5.0],
+            "put_oi": [20.0, 15.0, 0.0, 25.0, 5.0],
+        })
+
+        result = oi_analyzer.analyze_oi_changes(current, previous)
+
+        pd.testing.assert_frame_equal(result, _merge_oi_changes(current, previous))
+        # Missing current OI is no change, not a 100% unwind
+        assert result.loc[result["strike"] == 19600.0, "call_oi_change_pct"].item() == 0
+
+    def test_oi_changes_integer_oi(self, oi_analyzer, sample_option_chain):
+        """Test integer OI keeps the merge's dtypes."""
+        previous = sample_option_chain.iloc[::-1].reset_index(drop=True)
+        previous["call_oi"] = previous["call_oi"] // 2
+
+        result = oi_analyzer.analyze_oi_changes(sample_option_chain, previous)
+
+        pd.testing.assert_frame_equal(
+            result, _merge_oi_changes(sample_option_chain, previous)
+        )
+
+    def test_oi_changes_duplicate_strikes(self, oi_analyzer):
+        """Test duplicate strikes fall back to the merge's pairing."""
+        current = pd.DataFrame({
+            "strike": [19500.0, 19500.0, 19600.0],
+            "call_oi": [100.0, np.nan, 60.0],
+            "put_oi": [50.0, 70.0, 0.0],
+        })
+        previous = pd.DataFrame({
+            "strike": [19500.0, 19600.0, 19500.0],
+            "call_oi": [80.0, 0.0, 40.0],
+            "put_oi": [np.nan, 10.0, 35.0],
+        })
+
+        result = oi_analyzer.analyze_oi_changes(current, previous)
+
+        assert len(result) == 5
+        pd.testing.assert_frame_equal(result, _merge_oi_changes(current, previous))